@@ -0,0 +1,264 @@
+# benchmarks/hot_paths.py
+"""
+Headless benchmark suite for the game's hot paths.
+
+    python benchmarks/hot_paths.py --out bench.json
+    python benchmarks/hot_paths.py --compare bench.json   # flag regressions vs. a previous run
+
+Every case is seeded, warmed up, then timed op-by-op; results carry ops/sec
+and p50/p99 per-op timings in milliseconds.
+"""
+import os, sys, time, json, math, random, argparse, platform
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from core.headless import init_headless, make_hud
+
+def _percentile(sorted_samples, q):
+    i = min(len(sorted_samples) - 1, max(0, int(math.ceil(q * len(sorted_samples))) - 1))
+    return sorted_samples[i]
+
+def measure(op, iterations, warmup=5, setup=None):
+    """Time `op()` per call; `setup()` runs untimed before each call."""
+    for _ in range(warmup):
+        if setup: setup()
+        op()
+    samples = []
+    for _ in range(iterations):
+        if setup: setup()
+        t = time.perf_counter()
+        op()
+        samples.append(time.perf_counter() - t)
+    samples.sort()
+    total = sum(samples)
+    return {
+        "iterations": iterations,
+        "ops_per_sec": iterations / total if total else float("inf"),
+        "p50_ms": _percentile(samples, 0.50) * 1000.0,
+        "p99_ms": _percentile(samples, 0.99) * 1000.0,
+    }
+
+# ───────────────────────── cases ─────────────────────────
+def bench_tilemap(screen, iterations):
+    import pytmx
+    from core.camera import Camera
+    from ui.render.tilemap_renderer import TilemapRenderer
+    results = {}
+    for map_name in ("test_map.tmx", "test_map2.tmx"):
+        tmx = pytmx.load_pygame(os.path.join("assets", "maps", map_name))
+        world_w, world_h = tmx.width * tmx.tilewidth, tmx.height * tmx.tileheight
+        for zoom in Camera.ALLOWED_ZOOMS:
+            camera = Camera(800, 600, world_width=world_w, world_height=world_h)
+            camera.set_zoom(zoom)
+            renderer = TilemapRenderer(tmx, camera)
+            # pan diagonally across the map so chunk baking is part of the cost
+            pos = [world_w / 4, world_h / 4]
+            def pan():
+                pos[0] = (pos[0] + 4) % world_w
+                pos[1] = (pos[1] + 3) % world_h
+                camera.follow(_Point(*pos))
+            results[f"tilemap_draw[{map_name},zoom={zoom}]"] = measure(
+                lambda: renderer.draw(screen), iterations, setup=pan)
+    return results
+
+class _Point:
+    def __init__(self, x, y):
+        self.centerx, self.centery = int(x), int(y)
+
+def bench_projectiles(hud, iterations):
+    import pygame
+    from core.projectile import Projectile
+    from entities.enemies import Enemy
+    results = {}
+    system_cls = type(hud.projectile_system)
+    for count, targets in ((1000, 0), (10000, 0), (1000, 1000)):
+        rng = random.Random(count)
+        # unkillable targets keep the broad phase loaded; enemy shots resolve against the player
+        enemies = pygame.sprite.Group()
+        for _ in range(targets):
+            e = Enemy(rng.uniform(0, hud.map_width), rng.uniform(0, hud.map_height))
+            e.health = float("inf")
+            enemies.add(e)
+        system = system_cls(walls=hud.collision_map, enemies=enemies,
+                            explosion_system=hud.explosion_system, players=hud.players)
+        def top_up():
+            # keep the population constant; impacts from the last tick are replaced untimed
+            while len(system.projectiles) < count:
+                a = rng.uniform(0, 2 * math.pi)
+                system.add(Projectile.pool.acquire(start_pos=(rng.uniform(0, hud.map_width), rng.uniform(0, hud.map_height)),
+                                      direction=(math.cos(a), math.sin(a)), max_range=rng.uniform(200, 2000),
+                                      from_enemy=rng.random() < 0.5))
+            hud.explosion_system.explosions.empty()
+        name = f"{system_cls.__name__},n={count}" + (f",enemies={targets}" if targets else "")
+        results[f"projectile_update[{name}]"] = measure(
+            lambda: system.update(1 / 60), iterations, setup=top_up)
+    return results
+
+def bench_enemies(hud, iterations):
+    import pygame
+    from entities.enemies import Enemy
+    from systems.enemy_controller import EnemyController
+    try:
+        from systems.horde_enemy_controller import HordeEnemyController
+    except ImportError:
+        HordeEnemyController = None
+    from services.spawn_validator import SpawnValidator
+    results = {}
+    for count in (100, 1000, 5000):
+        random.seed(count)
+        enemies = pygame.sprite.Group()
+        for (x, y) in SpawnValidator.generate_spawns(count, hud.map_width, hud.map_height, hud.collision_map,
+                                                     max_attempts=count * 50):
+            enemies.add(Enemy(x, y))  # no projectile_group: measures AI/movement only
+        player = hud.player
+        def reset_player():
+            player.health = player.max_health
+        if count <= 1000:
+            for lod in (True, False):
+                controller = EnemyController(enemies, hud.collision_map, hud.map_rect, lod=lod)
+                results[f"enemy_controller_update[n={count}{'' if lod else ',lod=off'}]"] = measure(
+                    lambda: controller.update(1 / 60, player), iterations, setup=reset_player)
+        if HordeEnemyController is not None:
+            controller = HordeEnemyController(enemies, hud.collision_map, hud.map_rect)
+            results[f"horde_enemy_controller_update[n={count}]"] = measure(
+                lambda: controller.update(1 / 60, player), iterations, setup=reset_player)
+    return results
+
+def bench_collision(hud, iterations):
+    import pygame
+    rng = random.Random(7)
+    rects = [pygame.Rect(rng.randint(0, hud.map_width), rng.randint(0, hud.map_height), 20, 28)
+             for _ in range(1000)]
+    xs = [rng.uniform(0, hud.map_width) for _ in range(10000)]
+    ys = [rng.uniform(0, hud.map_height) for _ in range(10000)]
+    bitmap, grid = hud.collision_map, hud.collision_map.index
+    return {
+        "collision_bitmap_collides[x1000]": measure(lambda: [bitmap.collides(r) for r in rects], iterations),
+        "collision_grid_collides[x1000]": measure(lambda: [grid.collides(r) for r in rects], iterations),
+        "collision_bitmap_points_solid[x10000]": measure(lambda: bitmap.points_solid(xs, ys), iterations),
+    }
+
+def bench_spawns(hud, iterations):
+    from services.spawn_validator import SpawnValidator
+    random.seed(11)
+    return {
+        "spawn_validator_generate[want=50]": measure(
+            lambda: SpawnValidator.generate_spawns(50, hud.map_width, hud.map_height, hud.collision_tiles,
+                                                   avoid_point=(hud.spawn_x, hud.spawn_y), min_distance=150),
+            iterations),
+    }
+
+def bench_damage(hud, iterations):
+    from services.damage_service import DamageService
+    rng = random.Random(13)
+    types = [rng.choice(["ki", "fire", "ice", "KiBlast"]) for _ in range(10000)]
+    distances = [rng.uniform(0, 2000) for _ in range(10000)]
+    results = {
+        "damage_get_damage[x10000]": measure(
+            lambda: [DamageService.get_damage(t, d) for t, d in zip(types, distances)], iterations),
+        "damage_get_damages[x10000]": measure(lambda: DamageService.get_damages(types, distances), iterations),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+    rows, dist = np.array([DamageService.type_index(t) for t in types]), np.array(distances)
+    results["damage_get_damages[x10000,type_index]"] = measure(lambda: DamageService.get_damages(rows, dist), iterations)
+    return results
+
+def bench_chat_filter(hud, iterations):
+    import re, string
+    from services.profanity_filter import ProfanityMatcher
+    rng = random.Random(17)
+    vocab = ["the", "quick", "fox", "jumps", "over", "lazy", "dog", "hello", "world", "nice", "shot", "gg"]
+    results = {}
+    for count in (16, 10000):
+        words = sorted({"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+                        for _ in range(count)})
+        messages = [" ".join(rng.choice(words) if rng.random() < 0.02 else rng.choice(vocab)
+                             for _ in range(rng.randint(5, 20))) for _ in range(100)]
+        # the alternation regex chat_proxy_api used before the matcher
+        pattern = re.compile(r"\b(" + "|".join(map(re.escape, words)) + r")\b", re.IGNORECASE)
+        def regex_filter():
+            for m in messages:
+                if pattern.search(m):
+                    pattern.sub(lambda hit: "*" * (hit.end() - hit.start()), m)
+        matcher = ProfanityMatcher(words)
+        # the big regex takes ~0.5 s per op: keep its iteration count small
+        results[f"chat_filter_regex[words={count},x100]"] = measure(
+            regex_filter, iterations if count < 1000 else min(iterations, 10), warmup=1)
+        results[f"chat_filter_matcher[words={count},x100]"] = measure(
+            lambda: [matcher.censor(m) for m in messages], iterations)
+    return results
+
+# ───────────────────────── runner ─────────────────────────
+def run(iterations=200, only=None):
+    screen = init_headless()
+    hud = make_hud(screen).current_screen
+    suites = {
+        "tilemap": lambda: bench_tilemap(screen, iterations),
+        "projectiles": lambda: bench_projectiles(hud, iterations),
+        "enemies": lambda: bench_enemies(hud, iterations),
+        "collision": lambda: bench_collision(hud, iterations),
+        "spawns": lambda: bench_spawns(hud, iterations),
+        "damage": lambda: bench_damage(hud, iterations),
+        "chat": lambda: bench_chat_filter(hud, iterations),
+    }
+    cases = {}
+    for name, suite in suites.items():
+        if only and name not in only:
+            continue
+        cases.update(suite())
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    import pygame
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": numpy_version,
+            "machine": platform.machine(),
+            "iterations": iterations,
+        },
+        "cases": cases,
+    }
+
+def compare(current, baseline_path, threshold):
+    """Print per-case p50 ratios against a previous run; returns the regressed case names."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["cases"]
+    regressed = []
+    for name, res in current["cases"].items():
+        if name not in baseline:
+            continue
+        ratio = res["p50_ms"] / max(baseline[name]["p50_ms"], 1e-9)
+        flag = "REGRESSION" if ratio > threshold else ""
+        if flag:
+            regressed.append(name)
+        print(f"{name:60s} p50 {baseline[name]['p50_ms']:9.3f} -> {res['p50_ms']:9.3f} ms  x{ratio:5.2f} {flag}")
+    return regressed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths (headless)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--only", nargs="*", choices=["tilemap", "projectiles", "enemies", "collision", "spawns", "damage", "chat"])
+    parser.add_argument("--out", help="write results JSON here (default: stdout)")
+    parser.add_argument("--compare", help="previous results JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="p50 slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    out = os.path.abspath(args.out) if args.out else None
+    baseline = os.path.abspath(args.compare) if args.compare else None
+    os.chdir(ROOT)  # asset/config paths are relative to the project root
+    results = run(args.iterations, args.only)
+    if out:
+        with open(out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if baseline:
+        sys.exit(1 if compare(results, baseline, args.threshold) else 0)
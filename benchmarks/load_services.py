@@ -0,0 +1,151 @@
+# benchmarks/load_services.py
+"""
+Local load generator for the microservices.
+
+    python systems/serve.py chat --workers 16 &
+    python benchmarks/load_services.py chat --concurrency 32 --duration 10
+    python benchmarks/load_services.py all --duration 5      # every service, one after another
+
+Each of --concurrency client threads keeps an HTTP/1.1 connection open
+(reconnecting whenever the server closes it) and sends the service's request
+mix back-to-back for --duration seconds, or until --requests have been sent.
+Prints JSON per service: throughput, latency p50/p90/p99/max in milliseconds,
+and error and status counts.
+"""
+import os, sys, time, json, random, argparse, threading, http.client, urllib.parse, collections
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from services.service_client import DEFAULT_URLS
+
+RACES = ["Saiyan", "Namekian", "Android", "Shiba"]
+WORDS = ["the", "quick", "fox", "jumps", "over", "lazy", "dog", "nice", "shot", "gg", "again", "shit", "bastard"]
+
+def _message(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 15)))
+
+# ───────────── request mix per service: rng -> (method, path, JSON body or None) ─────────────
+def race_request(rng):
+    race = rng.choice(RACES)
+    return "GET", f"/races/{race}/{'metadata' if rng.random() < 0.8 else 'stats'}", None
+
+def damage_request(rng):
+    if rng.random() < 0.5:
+        return "GET", f"/damage?projectile_type={rng.choice(['ki', 'fire', 'ice'])}&distance={rng.uniform(0, 1500):.1f}", None
+    hits = [{"projectile_type": rng.choice(["ki", "fire", "ice", "_default"]), "distance": rng.uniform(0, 1500)}
+            for _ in range(32)]
+    return "POST", "/damage/batch", {"hits": hits}
+
+_layout = random.Random(0)
+_COLLIDERS = [[_layout.randint(0, 1500), _layout.randint(0, 1500), 32, 32] for _ in range(40)]
+
+def spawn_request(rng):
+    return "POST", "/spawns/generate", {
+        "want": 5, "map_width": 1600, "map_height": 1600, "collider_rects": _COLLIDERS,
+        "avoid_point": [rng.randint(0, 1600), rng.randint(0, 1600)], "min_distance": 150,
+    }
+
+def chat_request(rng):
+    if rng.random() < 0.8:
+        return "POST", "/filter", {"username": "load", "message": _message(rng)}
+    return "POST", "/filter/batch", {"messages": [{"username": "load", "message": _message(rng)} for _ in range(16)]}
+
+SCENARIOS = {"race": race_request, "damage": damage_request, "spawn": spawn_request, "chat": chat_request}
+
+# ───────────── runner ─────────────
+def _client(base_url, scenario, seed, deadline, budget, out, timeout):
+    parsed = urllib.parse.urlsplit(base_url)
+    host, port, prefix = parsed.hostname or "localhost", parsed.port or 80, parsed.path.rstrip("/")
+    rng = random.Random(seed)
+    latencies, statuses, errors = [], collections.Counter(), 0
+    conn = None
+    while time.perf_counter() < deadline and budget.take():
+        method, path, payload = scenario(rng)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        start = time.perf_counter()
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection(host, port, timeout=timeout)
+            conn.request(method, prefix + path, body, headers)
+            resp = conn.getresponse()
+            resp.read()
+            latencies.append(time.perf_counter() - start)
+            statuses[resp.status] += 1
+            if resp.status >= 400:
+                errors += 1
+            if resp.will_close:
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            if conn is not None:
+                conn.close()
+                conn = None
+    if conn is not None:
+        conn.close()
+    out.append((latencies, statuses, errors))
+
+class _Budget:
+    """Shared request allowance; unlimited when total is None."""
+    def __init__(self, total):
+        self.left, self._lock = total, threading.Lock()
+
+    def take(self):
+        if self.left is None:
+            return True
+        with self._lock:
+            if self.left <= 0:
+                return False
+            self.left -= 1
+            return True
+
+def run(service, base_url=None, concurrency=16, duration=10.0, requests=None, timeout=5.0, seed=1):
+    base_url = base_url or os.getenv(f"{service.upper()}_SERVICE_URL", DEFAULT_URLS[service])
+    out, budget = [], _Budget(requests)
+    start = time.perf_counter()
+    deadline = start + duration
+    threads = [threading.Thread(target=_client, args=(base_url, SCENARIOS[service], seed + i, deadline,
+                                                      budget, out, timeout), daemon=True)
+               for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    samples = sorted(l for lat, _, _ in out for l in lat)
+    statuses = collections.Counter()
+    for _, s, _ in out:
+        statuses.update(s)
+    errors = sum(e for _, _, e in out)
+    pick = lambda q: 1000.0 * samples[min(len(samples) - 1, int(q * len(samples)))] if samples else 0.0
+    return {
+        "service": service,
+        "url": base_url,
+        "concurrency": concurrency,
+        "wall_seconds": elapsed,
+        "requests": len(samples),
+        "errors": errors,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "requests_per_second": len(samples) / elapsed if elapsed else 0.0,
+        "p50_ms": pick(0.50),
+        "p90_ms": pick(0.90),
+        "p99_ms": pick(0.99),
+        "max_ms": pick(1.0),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate load against a local microservice")
+    parser.add_argument("service", choices=sorted(SCENARIOS) + ["all"])
+    parser.add_argument("--url", help="base URL (default: <NAME>_SERVICE_URL or the usual localhost port)")
+    parser.add_argument("--concurrency", type=int, default=16, help="client threads, one connection each")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per service")
+    parser.add_argument("--requests", type=int, default=None, help="stop after this many requests")
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    services = sorted(SCENARIOS) if args.service == "all" else [args.service]
+    results = [run(s, args.url if args.service != "all" else None, args.concurrency, args.duration,
+                   args.requests, args.timeout, args.seed) for s in services]
+    print(json.dumps(results if len(results) > 1 else results[0], indent=2))
@@ -0,0 +1,73 @@
+# core/asset_manager.py
+import os, pygame
+
+class AssetManager:
+    """
+    Decodes every image once and hands out shared frame slices.
+
+    Frame lists are tuples of subsurfaces over the shared sheet, so spawning an
+    entity costs no disk I/O and no pixel copies. Treat returned surfaces as
+    read-only: they are shared by every entity using the same sheet.
+    """
+    ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    _images = {}   # abs path -> Surface
+    _frames = {}   # (abs path, slice params) -> tuple[Surface, ...]
+
+    @classmethod
+    def resolve(cls, path):
+        return path if os.path.isabs(path) else os.path.join(cls.ROOT, path)
+
+    @classmethod
+    def image(cls, path):
+        path = cls.resolve(path)
+        img = cls._images.get(path)
+        if img is None:
+            img = pygame.image.load(path).convert_alpha()
+            cls._images[path] = img
+        return img
+
+    @staticmethod
+    def _trim(surface):
+        rects = pygame.mask.from_surface(surface).get_bounding_rects()
+        return surface.subsurface(rects[0]) if rects else surface
+
+    @classmethod
+    def frames(cls, path, frame_w, frame_h, count, start=0, trim=False):
+        """`count` frames laid out left-to-right, starting at frame `start`."""
+        key = (cls.resolve(path), frame_w, frame_h, count, start, trim)
+        frames = cls._frames.get(key)
+        if frames is None:
+            sheet = cls.image(path)
+            frames = tuple(
+                sheet.subsurface(pygame.Rect((start + i) * frame_w, 0, frame_w, frame_h))
+                for i in range(count)
+            )
+            if trim:
+                frames = tuple(cls._trim(f) for f in frames)
+            cls._frames[key] = frames
+        return frames
+
+    @classmethod
+    def strip(cls, path):
+        """Square frames side-by-side, e.g. an explosion strip."""
+        sheet = cls.image(path)
+        w, h = sheet.get_size()
+        return cls.frames(path, h, h, w // h)
+
+    @classmethod
+    def memory_bytes(cls):
+        # frames are subsurfaces, so only the decoded images own pixels
+        return sum(img.get_width() * img.get_height() * img.get_bytesize()
+                   for img in cls._images.values())
+
+    @classmethod
+    def memory_report(cls):
+        return {
+            os.path.relpath(path, cls.ROOT): img.get_width() * img.get_height() * img.get_bytesize()
+            for path, img in cls._images.items()
+        }
+
+    @classmethod
+    def clear(cls):
+        cls._images.clear()
+        cls._frames.clear()
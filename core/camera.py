@@ -1,6 +1,8 @@
 # core/camera.py
 import pygame
 class Camera:
+    ALLOWED_ZOOMS = (0.5, 1.0, 1.5, 2.0)
+
     def __init__(self, viewport_width, viewport_height, world_width=None, world_height=None):
         self.offset_x = 0
         self.offset_y = 0
@@ -45,8 +47,13 @@ class Camera:
     def apply_point(self, x, y):
         return int((x - self.offset_x) * self.zoom), int((y - self.offset_y) * self.zoom)
 
+    def view_rect(self, margin=0):
+        """World-space area currently on screen, grown by `margin` px on every side."""
+        return pygame.Rect(int(self.offset_x) - margin, int(self.offset_y) - margin,
+                           int(self.viewport_width / self.zoom) + 1 + 2 * margin,
+                           int(self.viewport_height / self.zoom) + 1 + 2 * margin)
+
     def set_zoom(self, zoom_amount):
-        allowed_zooms = [0.5, 1.0, 1.5, 2.0]
-        closest = min(allowed_zooms, key=lambda z: abs(z - zoom_amount))
+        closest = min(self.ALLOWED_ZOOMS, key=lambda z: abs(z - zoom_amount))
         self.zoom = closest
 
@@ -0,0 +1,202 @@
+# core/collision_bitmap.py
+import pygame
+from core.spatial_grid import SpatialGrid
+
+try:
+    import numpy as np
+except ImportError:  # bulk queries fall back to per-point lookups
+    np = None
+
+EMPTY, PARTIAL, SOLID = 0, 1, 2
+
+class CollisionBitmap:
+    """
+    Per-tile rasterization of the collision rects, one byte per tile.
+
+    Tiles fully covered by a collision rect are SOLID, tiles only touched by
+    one are PARTIAL, everything else is EMPTY. Queries read the few tiles a
+    point or rect overlaps and only fall back to the exact SpatialGrid when a
+    PARTIAL tile is involved, so results match the rect-based checks.
+
+    Exposes the same collides/query_rect/iteration API as SpatialGrid, so it
+    can be handed to anything that expects the collision index.
+    """
+    def __init__(self, cols, rows, tile_w, tile_h, rects=()):
+        self.cols, self.rows = cols, rows
+        self.tile_w, self.tile_h = tile_w, tile_h
+        self.cells = bytearray(cols * rows)
+        self.index = SpatialGrid.ensure(list(rects))
+        for r in self.index:
+            self._rasterize(r)
+        self._coverage = None  # built on first bulk query, see _covered()
+        self._windows = {}     # (span_x, span_y) -> per-tile max state, see _window()
+
+    @classmethod
+    def from_tmx(cls, tmx_data, rects):
+        return cls(tmx_data.width, tmx_data.height, tmx_data.tilewidth, tmx_data.tileheight, rects)
+
+    def _tile_span(self, rect):
+        tx0 = max(0, rect.left // self.tile_w)
+        ty0 = max(0, rect.top // self.tile_h)
+        tx1 = min(self.cols - 1, (rect.right - 1) // self.tile_w)
+        ty1 = min(self.rows - 1, (rect.bottom - 1) // self.tile_h)
+        return tx0, ty0, tx1, ty1
+
+    def _rasterize(self, rect):
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        tx0, ty0, tx1, ty1 = self._tile_span(rect)
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                i = ty * self.cols + tx
+                tile = pygame.Rect(tx * self.tile_w, ty * self.tile_h, self.tile_w, self.tile_h)
+                if rect.contains(tile):
+                    self.cells[i] = SOLID
+                elif self.cells[i] == EMPTY:
+                    self.cells[i] = PARTIAL
+
+    # ─────────── SpatialGrid-compatible API ───────────
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def query_rect(self, rect):
+        return self.index.query_rect(rect)
+
+    def tile_at(self, tx, ty):
+        if 0 <= tx < self.cols and 0 <= ty < self.rows:
+            return self.cells[ty * self.cols + tx]
+        return EMPTY
+
+    def point_solid(self, x, y):
+        state = self.tile_at(int(x // self.tile_w), int(y // self.tile_h))
+        if state == PARTIAL:
+            return self.index.collides(pygame.Rect(int(x), int(y), 1, 1))
+        return state == SOLID
+
+    def collides(self, rect):
+        if not isinstance(rect, pygame.Rect):
+            rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        tw, th, cols, rows = self.tile_w, self.tile_h, self.cols, self.rows
+        tx0, ty0 = rect.left // tw, rect.top // th
+        tx1, ty1 = (rect.right - 1) // tw, (rect.bottom - 1) // th
+        # a rect poking outside the map always needs the exact rects
+        partial = tx0 < 0 or ty0 < 0 or tx1 >= cols or ty1 >= rows
+        if partial:
+            tx0, ty0 = max(tx0, 0), max(ty0, 0)
+            tx1, ty1 = min(tx1, cols - 1), min(ty1, rows - 1)
+            if tx0 > tx1 or ty0 > ty1:  # entirely off the map
+                return self.index.collides(rect)
+        cells = self.cells
+        for ty in range(ty0, ty1 + 1):
+            row = cells[ty * cols + tx0: ty * cols + tx1 + 1]
+            if SOLID in row:
+                return True
+            if not partial and PARTIAL in row:
+                partial = True
+        # partially covered tiles need the exact rects
+        return partial and self.index.collides(rect)
+
+    def points_solid(self, xs, ys):
+        """Vectorized point_solid over many points; returns a bool array (list without NumPy)."""
+        if np is None:
+            return [self.point_solid(x, y) for x, y in zip(xs, ys)]
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        tx = np.floor_divide(xs, self.tile_w).astype(np.intp)
+        ty = np.floor_divide(ys, self.tile_h).astype(np.intp)
+        inside = (tx >= 0) & (tx < self.cols) & (ty >= 0) & (ty < self.rows)
+        grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+        states = np.zeros(xs.shape, dtype=np.uint8)
+        states[inside] = grid[ty[inside], tx[inside]]
+        out = states == SOLID
+        check = np.flatnonzero(states == PARTIAL)
+        if len(check):
+            ones = np.ones(len(check), dtype=np.int64)
+            out[check] = self._covered(np.trunc(xs[check]).astype(np.int64),
+                                       np.trunc(ys[check]).astype(np.int64), ones, ones)
+        return out
+
+    def rects_solid(self, lefts, tops, widths, heights):
+        """Vectorized collides() over many rects; returns a bool array (list without NumPy)."""
+        if np is None:
+            return [self.collides((l, t, w, h)) for l, t, w, h in zip(lefts, tops, widths, heights)]
+        l = np.asarray(lefts, dtype=np.int64)
+        t = np.asarray(tops, dtype=np.int64)
+        w = np.asarray(widths, dtype=np.int64)
+        h = np.asarray(heights, dtype=np.int64)
+        valid = (w > 0) & (h > 0)
+        tx0, ty0 = l // self.tile_w, t // self.tile_h
+        tx1, ty1 = (l + w - 1) // self.tile_w, (t + h - 1) // self.tile_h
+        # rects poking outside the map always get the exact check
+        partial = (tx0 < 0) | (ty0 < 0) | (tx1 >= self.cols) | (ty1 >= self.rows)
+        on_map = valid & (tx1 >= 0) & (ty1 >= 0) & (tx0 < self.cols) & (ty0 < self.rows)
+        tx0, tx1 = np.clip(tx0, 0, self.cols - 1), np.clip(tx1, 0, self.cols - 1)
+        ty0, ty1 = np.clip(ty0, 0, self.rows - 1), np.clip(ty1, 0, self.rows - 1)
+        # worst tile state under each rect: one lookup per rect in the table for its tile span
+        states = np.zeros(l.shape, dtype=np.uint8)
+        idx = np.flatnonzero(on_map)
+        if len(idx):
+            span = (tx1[idx] - tx0[idx] + 1) * (self.rows + 1) + (ty1[idx] - ty0[idx] + 1)
+            # usually a single span (same-sized actors): skip the sort in np.unique
+            keys = span[:1] if span.min() == span.max() else np.unique(span)
+            for key in keys:
+                sel = idx if len(keys) == 1 else idx[span == key]
+                window = self._window(int(key // (self.rows + 1)), int(key % (self.rows + 1)))
+                states[sel] = window[ty0[sel], tx0[sel]]
+        solid = states == SOLID
+        partial |= states == PARTIAL
+        out = solid & valid
+        check = np.flatnonzero(valid & ~solid & partial)
+        if len(check):
+            out[check] = self._covered(l[check], t[check], w[check], h[check])
+        return out
+
+    def _window(self, span_x, span_y):
+        """Per tile, the max state (SOLID > PARTIAL > EMPTY) over the span_x x span_y tiles from it."""
+        window = self._windows.get((span_x, span_y))
+        if window is None:
+            grid = np.zeros((self.rows + span_y - 1, self.cols + span_x - 1), dtype=np.uint8)
+            grid[:self.rows, :self.cols] = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+            rows = grid[:, :self.cols].copy()
+            for ox in range(1, span_x):
+                np.maximum(rows, grid[:, ox:ox + self.cols], out=rows)
+            window = rows[:self.rows].copy()
+            for oy in range(1, span_y):
+                np.maximum(window, rows[oy:oy + self.rows], out=window)
+            self._windows[(span_x, span_y)] = window
+        return window
+
+    def _covered(self, l, t, w, h):
+        """
+        Exact vectorized colliderect against the collision rects, for the rects
+        the tiles could not decide. Uses a summed-area table over the grid cut
+        by every rect edge (coordinate compression): each compressed cell is
+        either fully inside some rect or fully outside all of them, so a query
+        is four table lookups after a binary search per edge.
+        """
+        if self._coverage is None:
+            rects = [r for r in self.index if r.width > 0 and r.height > 0]
+            xs = np.unique(np.array([e for r in rects for e in (r.left, r.right)] or [0], dtype=np.int64))
+            ys = np.unique(np.array([e for r in rects for e in (r.top, r.bottom)] or [0], dtype=np.int64))
+            solid = np.zeros((len(ys), len(xs)), dtype=np.int32)
+            for r in rects:
+                solid[np.searchsorted(ys, r.top):np.searchsorted(ys, r.bottom),
+                      np.searchsorted(xs, r.left):np.searchsorted(xs, r.right)] = 1
+            table = np.zeros((len(ys) + 1, len(xs) + 1), dtype=np.int32)
+            table[1:, 1:] = solid.cumsum(0).cumsum(1)
+            self._coverage = (xs, ys, table)
+        xs, ys, table = self._coverage
+        # compressed cells [xs[i], xs[i+1]) overlapping [l, l+w): i0..i1
+        i0 = np.maximum(np.searchsorted(xs, l, "right") - 1, 0)
+        i1 = np.minimum(np.searchsorted(xs, l + w, "left") - 1, len(xs) - 2)
+        j0 = np.maximum(np.searchsorted(ys, t, "right") - 1, 0)
+        j1 = np.minimum(np.searchsorted(ys, t + h, "left") - 1, len(ys) - 2)
+        nonempty = (i1 >= i0) & (j1 >= j0) & (w > 0) & (h > 0)
+        i1, j1 = np.maximum(i1, i0), np.maximum(j1, j0)
+        area = table[j1 + 1, i1 + 1] - table[j0, i1 + 1] - table[j1 + 1, i0] + table[j0, i0]
+        return nonempty & (area > 0)
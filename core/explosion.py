@@ -1,22 +1,17 @@
 # core/explosion.py
 import pygame
 import os
+from core.asset_manager import AssetManager
+from core.object_pool import ObjectPool
 
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, x, y, frame_duration=0.05):
         super().__init__()
-        # load the full strip
-        sheet_path = os.path.join("assets", "fx", "Explosion1.png")
-        sheet = pygame.image.load(sheet_path).convert_alpha()
-        sheet_w, sheet_h = sheet.get_size()
+        self.reset(x, y, frame_duration)
 
-        # assume square frames laid out side-by-side:
-        frame_count = sheet_w // sheet_h
-        self.frames = []
-        for i in range(frame_count):
-            rect = pygame.Rect(i * sheet_h, 0, sheet_h, sheet_h)
-            # subsurface + .copy() to get an independent Surface
-            self.frames.append(sheet.subsurface(rect).copy())
+    def reset(self, x, y, frame_duration=0.05):
+        # square frames laid out side-by-side, decoded once and shared
+        self.frames = AssetManager.strip(os.path.join("assets", "fx", "Explosion1.png"))
 
         # animation state
         self.frame_index = 0
@@ -44,3 +39,6 @@ class Explosion(pygame.sprite.Sprite):
         img = pygame.transform.rotozoom(self.image, 0, zoom)
         r = img.get_rect(center=(sx, sy))
         surface.blit(img, r)
+
+# finished explosions go back through ExplosionSystem's group
+Explosion.pool = ObjectPool(Explosion)
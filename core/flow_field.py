@@ -0,0 +1,185 @@
+# core/flow_field.py
+import heapq
+from core.collision_bitmap import EMPTY
+from core.profiler import PROFILER
+
+try:
+    import numpy as np
+except ImportError:  # steps_toward_many() needs NumPy; step_toward() does not
+    np = None
+
+# (dx, dy, cost): orthogonal 10, diagonal 14 (~10·√2)
+_STEPS = ((1, 0, 10), (-1, 0, 10), (0, 1, 10), (0, -1, 10),
+          (1, 1, 14), (1, -1, 14), (-1, 1, 14), (-1, -1, 14))
+_UNREACHED = 1 << 30
+_WALKABLE, _BLOCKED = 1, 2
+
+class FlowField:
+    """
+    Shortest-path field toward one target tile, shared by every chaser.
+
+    Built with Dijkstra over the CollisionBitmap's walkable tiles (8-way, no
+    cutting past wall corners) whenever the target moves to another tile, and
+    only once someone asks for a step. Each lookup is then O(1): the tile an
+    actor stands on points at the next tile along a shortest path.
+
+    With `radius` (px), the search stops once paths are longer than that, so a
+    rebuild only touches the square window of tiles around the target and
+    costs the same on any map size; actors beyond it get no step. Walkability
+    is worked out the first time a window covers a tile (one vectorized pass
+    per build) and neighbour lists are cached per tile.
+
+    With `agent_size`, a tile is walkable when an agent of that size centred
+    on it fits; otherwise when it is EMPTY.
+    """
+    def __init__(self, bitmap, agent_size=None, radius=None):
+        self.bitmap = bitmap
+        self.agent_size = agent_size
+        self.cols, self.rows = bitmap.cols, bitmap.rows
+        self.tile_w, self.tile_h = bitmap.tile_w, bitmap.tile_h
+        # search radius in tiles; every tile stepped costs >= 10, so a cost cutoff of 10·reach stays within it
+        self.reach = None if radius is None else -(-radius // min(self.tile_w, self.tile_h))
+        self.passable = bytearray(self.cols * self.rows)  # 0 not yet checked, else _WALKABLE / _BLOCKED
+        self.window = (0, 0, self.cols, self.rows)         # tx0, ty0, tx1, ty1 (exclusive) of the last build
+        self.dist = {}
+        self.next_tile = {}
+        self._link_cache = {}
+        self.target = None
+        self.builds = 0
+        self._dirty = False
+        self._next_array = None
+
+    def _classify(self, x0, y0, x1, y1):
+        """Fill in walkability for the unchecked tiles of a window."""
+        cols, ok = self.cols, self.passable
+        todo = [ty * cols + tx for ty in range(y0, y1) for tx in range(x0, x1) if not ok[ty * cols + tx]]
+        if not todo:
+            return
+        if self.agent_size is None:
+            cells = self.bitmap.cells
+            for i in todo:
+                ok[i] = _WALKABLE if cells[i] == EMPTY else _BLOCKED
+            return
+        w, h = self.agent_size
+        # same placement as pygame's Rect.center = tile centre
+        lefts = [int((i % cols + 0.5) * self.tile_w) - w // 2 for i in todo]
+        tops = [int((i // cols + 0.5) * self.tile_h) - h // 2 for i in todo]
+        solid = self.bitmap.rects_solid(lefts, tops, [w] * len(todo), [h] * len(todo))
+        for i, hit in zip(todo, solid):
+            ok[i] = _BLOCKED if hit else _WALKABLE
+
+    def _links(self, i):
+        """
+        Walkable neighbours of tile i as (tile, cost), cached per tile since the
+        map is static. The tiles around i must already be classified.
+        """
+        out = self._link_cache.get(i)
+        if out is not None:
+            return out
+        cols, rows, ok = self.cols, self.rows, self.passable
+        tx, ty = i % cols, i // cols
+        out = []
+        for dx, dy, cost in _STEPS:
+            nx, ny = tx + dx, ty + dy
+            if not (0 <= nx < cols and 0 <= ny < rows) or ok[ny * cols + nx] != _WALKABLE:
+                continue
+            if dx and dy and not (ok[ty * cols + nx] == _WALKABLE and ok[ny * cols + tx] == _WALKABLE):
+                continue  # diagonal would clip a wall corner
+            out.append((ny * cols + nx, cost))
+        out = self._link_cache[i] = tuple(out)
+        return out
+
+    def tile_index(self, x, y):
+        tx = min(self.cols - 1, max(0, int(x) // self.tile_w))
+        ty = min(self.rows - 1, max(0, int(y) // self.tile_h))
+        return ty * self.cols + tx
+
+    def set_target(self, x, y):
+        tile = self.tile_index(x, y)
+        if tile != self.target:
+            self.target = tile
+            self._dirty = True
+
+    def _build(self):
+        with PROFILER.scope("update.enemies.flow"):
+            if self.reach is None:
+                self.window, limit = (0, 0, self.cols, self.rows), _UNREACHED
+            else:
+                # tiles expanded lie within `reach` of the target; their neighbours one further
+                tx, ty, r = self.target % self.cols, self.target // self.cols, self.reach + 1
+                self.window = (max(0, tx - r), max(0, ty - r), min(self.cols, tx + r + 1), min(self.rows, ty + r + 1))
+                limit = 10 * self.reach
+            self._classify(*self.window)
+            cache, links = self._link_cache, self._links
+            dist, nxt = {self.target: 0}, {}
+            heap = [(0, self.target)]
+            while heap:
+                d, i = heapq.heappop(heap)
+                if d > limit:
+                    break
+                if d > dist[i]:
+                    continue
+                for j, cost in cache.get(i) or links(i):
+                    nd = d + cost
+                    if nd < dist.get(j, _UNREACHED):
+                        dist[j] = nd
+                        nxt[j] = i
+                        heapq.heappush(heap, (nd, j))
+            self.dist, self.next_tile = dist, nxt
+            self._next_array = None
+            self._dirty = False
+            self.builds += 1
+
+    def step_toward(self, x, y):
+        """
+        World-space centre of the next tile on the way to the target from (x, y).
+        None when (x, y) is on or next to the target tile, outside the search
+        window, or cannot reach it: callers then head straight for the target.
+        """
+        if self.target is None:
+            return None
+        if self._dirty:
+            self._build()
+        i = self.tile_index(x, y)
+        j = self.next_tile.get(i, -1)
+        if j < 0 and i != self.target:
+            # standing on a wall-touching tile: step to the best walkable neighbour
+            tx, ty = i % self.cols, i // self.cols
+            self._classify(max(0, tx - 1), max(0, ty - 1), min(self.cols, tx + 2), min(self.rows, ty + 2))
+            best = _UNREACHED
+            for n, cost in self._links(i):
+                d = self.dist.get(n, _UNREACHED) + cost
+                if d < best:
+                    best, j = d, n
+        if j < 0 or j == self.target:
+            return None
+        return ((j % self.cols + 0.5) * self.tile_w, (j // self.cols + 0.5) * self.tile_h)
+
+    def steps_toward_many(self, xs, ys):
+        """
+        Vectorized step_toward over NumPy coordinate arrays: returns (tx, ty, ok),
+        where ok is False wherever step_toward would return None. Actors on
+        wall-touching tiles or outside the window get no step here and head
+        straight for the target.
+        """
+        n = len(xs)
+        if self.target is None:
+            return np.zeros(n), np.zeros(n), np.zeros(n, dtype=bool)
+        if self._dirty:
+            self._build()
+        x0, y0, x1, y1 = self.window
+        if self._next_array is None:
+            # next tile per window tile, -1 where there is none
+            grid = np.full((y1 - y0, x1 - x0), -1, dtype=np.int64)
+            if self.next_tile:
+                src = np.fromiter(self.next_tile.keys(), dtype=np.int64, count=len(self.next_tile))
+                grid[src // self.cols - y0, src % self.cols - x0] = np.fromiter(
+                    self.next_tile.values(), dtype=np.int64, count=len(self.next_tile))
+            self._next_array = grid
+        tx = np.clip(xs.astype(np.int64) // self.tile_w, 0, self.cols - 1)
+        ty = np.clip(ys.astype(np.int64) // self.tile_h, 0, self.rows - 1)
+        inside = (tx >= x0) & (tx < x1) & (ty >= y0) & (ty < y1)
+        j = np.full(n, -1, dtype=np.int64)
+        j[inside] = self._next_array[ty[inside] - y0, tx[inside] - x0]
+        ok = (j >= 0) & (j != self.target)
+        return (j % self.cols + 0.5) * self.tile_w, (j // self.cols + 0.5) * self.tile_h, ok
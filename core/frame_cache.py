@@ -0,0 +1,37 @@
+# core/frame_cache.py
+import pygame
+
+class FrameCache:
+    """
+    Process-wide cache of zoom-scaled animation frames shared by every entity.
+
+    Keys are (sheet, direction, frame_index); the zoom is appended internally.
+    Frames are scaled lazily on first use and the whole cache is dropped when
+    the zoom changes, so drawing an entity costs a single blit.
+    """
+    _frames = {}
+    _zoom = None
+
+    @classmethod
+    def get(cls, key, surface, zoom):
+        if zoom == 1.0:
+            return surface
+        if zoom != cls._zoom:
+            cls._frames.clear()
+            cls._zoom = zoom
+        full_key = (*key, zoom)
+        img = cls._frames.get(full_key)
+        if img is None:
+            img = pygame.transform.scale(surface, (int(surface.get_width() * zoom),
+                                                   int(surface.get_height() * zoom)))
+            cls._frames[full_key] = img
+        return img
+
+    @classmethod
+    def clear(cls):
+        cls._frames.clear()
+        cls._zoom = None
+
+    @classmethod
+    def size(cls):
+        return len(cls._frames)
@@ -2,16 +2,25 @@
 import pygame
 from entities.player import Player
 from core.projectile import Projectile
+from core.profiler import PROFILER
 from ui.screens.login_screen import LoginScreen
 from ui.screens.char_select_screen import CharacterSelectScreen
 from ui.screens.char_create_screen import CharacterCreateScreen
 from ui.screens.hud_screen import HUDScreen
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, fixed_dt=1/60, recorder=None):
         self.screen = screen
         self.bg_color = (25, 25, 40)  # A darker color for the background
 
+        # fixed simulation step (seconds) and how far the renderer is between
+        # the last two simulated states (0..1), set by the main loop
+        self.fixed_dt = fixed_dt
+        self.render_alpha = 1.0
+
+        # optional core.replay.InputRecorder; the HUD writes its ticks into it
+        self.recorder = recorder
+
         # ADD map/world dimensions
         self.map_width = 1600
         self.map_height = 1600
@@ -43,10 +52,14 @@ class Game:
                 pygame.quit()
                 exit()
         # Always update the active instance
-        self.current_screen.update(dt, events)
+        with PROFILER.scope("update"):
+            self.current_screen.update(dt, events)
 
-    def draw(self):
-        self.screen.fill(self.bg_color)
-        # Always draw the active instance
-        self.current_screen.draw(self.screen)
-        pygame.display.flip()
+    def draw(self, alpha=1.0):
+        self.render_alpha = alpha
+        with PROFILER.scope("draw"):
+            self.screen.fill(self.bg_color)
+            # Always draw the active instance
+            self.current_screen.draw(self.screen)
+        with PROFILER.scope("flip"):
+            pygame.display.flip()
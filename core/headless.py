@@ -0,0 +1,76 @@
+# core/headless.py
+import os, sys, time, json, random, argparse
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def init_headless(size=(800, 600)):
+    """Initialise pygame with the SDL dummy drivers; returns the (invisible) display surface."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+    pygame.init()
+    # a display mode is still required for convert_alpha() and fonts
+    return pygame.display.set_mode(size)
+
+def make_hud(screen, fixed_dt=1/60, **hud_kwargs):
+    """A Game sitting on the HUD screen, without going through login/character select."""
+    from core.game import Game
+    game = Game(screen, fixed_dt=fixed_dt)
+    game.set_screen("hud", **hud_kwargs)
+    return game
+
+def run(ticks=3600, sim_hz=60, seed=None, extra_enemies=0, horde=False):
+    """
+    Tick HUDScreen's player, enemy, projectile and explosion systems `ticks`
+    times as fast as possible: no drawing and no frame cap. Returns timing stats.
+    """
+    screen = init_headless()
+    from entities.enemies import Enemy
+    from services.spawn_validator import SpawnValidator
+
+    if seed is not None:
+        random.seed(seed)
+    dt = 1.0 / sim_hz
+    hud = make_hud(screen, fixed_dt=dt, horde=horde).current_screen
+
+    # optional extra population for soak tests
+    for (x, y) in SpawnValidator.generate_spawns(extra_enemies, hud.map_width, hud.map_height,
+                                                 hud.collision_map, max_attempts=extra_enemies * 20):
+        e = Enemy(x, y)
+        e.projectile_group = hud.projectile_system
+        hud.enemies.add(e)
+
+    from core.jobs import JOBS
+    from core.profiler import PROFILER
+    start = time.perf_counter()
+    for _ in range(ticks):
+        JOBS.drain()  # e.g. the spawn-service reply, as the windowed loop does per frame
+        with PROFILER.scope("update"):
+            hud.update(dt, [])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "sim_hz": sim_hz,
+        "sim_seconds": ticks * dt,
+        "wall_seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed else float("inf"),
+        "speedup": (ticks * dt) / elapsed if elapsed else float("inf"),
+        "enemies": len(hud.enemies),
+        "projectiles": len(hud.projectile_system.projectiles),
+        "explosions": len(hud.explosion_system.explosions),
+        "pools": {"projectiles": hud.projectile_system.pool.stats(),
+                  "explosions": hud.explosion_system.pool.stats()},
+        "jobs": JOBS.stats(),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the HUD simulation headless, uncapped")
+    parser.add_argument("--ticks", type=int, default=3600)
+    parser.add_argument("--sim-hz", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--enemies", type=int, default=0, help="extra enemies to spawn")
+    parser.add_argument("--horde", action="store_true", help="vectorized enemy AI (needs NumPy)")
+    args = parser.parse_args()
+    # asset/config paths are relative to the project root
+    os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    print(json.dumps(run(args.ticks, args.sim_hz, args.seed, args.enemies, args.horde), indent=2))
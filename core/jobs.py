@@ -0,0 +1,88 @@
+# core/jobs.py
+import time, queue, threading, collections
+from core.profiler import PROFILER
+
+class JobExecutor:
+    """
+    Fixed-size thread pool for blocking work (service calls, prefetches).
+
+    submit() queues fn(*args) for one of `workers` threads, started on first
+    use, and returns False without queueing when `max_pending` jobs are
+    already waiting. Workers never touch game state: results are parked on a
+    completion queue, and drain(), called by the main loop once per frame,
+    runs each job's on_done(result) or on_error(exc) on the main thread until
+    the queue is empty or the time budget is spent.
+    """
+    def __init__(self, workers=4, max_pending=64):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._done = collections.deque()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def _start(self):
+        while len(self._threads) < self.workers:
+            t = threading.Thread(target=self._worker, name=f"job-worker-{len(self._threads)}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, fn, *args, on_done=None, on_error=None):
+        if not self._threads:
+            self._start()
+        try:
+            self._pending.put_nowait((fn, args, on_done, on_error))
+        except queue.Full:
+            self.rejected += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def _worker(self):
+        while True:
+            fn, args, on_done, on_error = self._pending.get()
+            with self._lock:
+                self.running += 1
+            try:
+                result, error = fn(*args), None
+            except Exception as e:
+                result, error = None, e
+            with self._lock:
+                self.running -= 1
+            self._done.append((on_done, on_error, result, error))
+
+    def drain(self, budget=0.002):
+        """Run finished jobs' callbacks on the calling (main) thread for up to `budget` seconds; returns how many ran."""
+        deadline = time.perf_counter() + budget
+        ran = 0
+        while self._done:
+            on_done, on_error, result, error = self._done.popleft()
+            if error is None:
+                self.completed += 1
+                if on_done is not None:
+                    on_done(result)
+            else:
+                self.failed += 1
+                if on_error is not None:
+                    on_error(error)
+            ran += 1
+            if time.perf_counter() >= deadline:
+                break  # the rest waits for the next frame
+        if PROFILER.active:
+            PROFILER.count("jobs.pending", self._pending.qsize())
+            PROFILER.count("jobs.running", self.running)
+            PROFILER.count("jobs.finished", len(self._done))
+        return ran
+
+    def stats(self):
+        return {"pending": self._pending.qsize(), "running": self.running, "finished": len(self._done),
+                "submitted": self.submitted, "completed": self.completed,
+                "failed": self.failed, "rejected": self.rejected}
+
+# process-wide instance; the main loop drains it once per frame
+JOBS = JobExecutor()
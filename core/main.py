@@ -2,21 +2,83 @@ import pygame
 import sys
 import os
 import time
+import argparse
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.game import Game
+from core.jobs import JOBS
+from core.profiler import PROFILER
 
-def main():
+SIM_HZ = 60              # fixed simulation rate; 120 gives finer collision steps
+RENDER_FPS = 60          # frame cap for drawing
+MAX_STEPS_PER_FRAME = 5  # catch-up cap so a long hitch can't spiral
+JOB_BUDGET = 0.002       # seconds per frame for applying background job results
+
+def main(sim_hz=SIM_HZ, render_fps=RENDER_FPS, recorder=None):
     pygame.init()
     screen = pygame.display.set_mode((800, 600))
     pygame.display.set_caption("Kagetsu no Shiba")
 
     clock = pygame.time.Clock()
-    game = Game(screen)
+    step = 1.0 / sim_hz
+    game = Game(screen, fixed_dt=step, recorder=recorder)
 
+    accumulator = 0.0
     while True:
-        dt = clock.tick(60) / 1000.0  # Convert ms to seconds
-        game.update(dt)
-        game.draw()
+        accumulator += clock.tick(render_fps) / 1000.0  # Convert ms to seconds
+
+        # simulate in fixed steps; the remainder carries over to the next frame
+        with PROFILER.scope("frame"):
+            # finished service calls/prefetches hand their results over here, on the main thread
+            with PROFILER.scope("jobs"):
+                JOBS.drain(JOB_BUDGET)
+            steps = 0
+            while accumulator >= step and steps < MAX_STEPS_PER_FRAME:
+                game.update(step)
+                accumulator -= step
+                steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                accumulator = min(accumulator, step)  # drop the backlog after a hitch
+
+            # draw between the last two simulated states
+            game.draw(accumulator / step)
+        PROFILER.count("sim_steps", steps)
+        # roll the window only once the frame scope has closed, so its total lands in this frame
+        PROFILER.end_frame()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Kagetsu no Shiba")
+    parser.add_argument("--sim-hz", type=int, default=SIM_HZ, help="fixed simulation ticks per second")
+    parser.add_argument("--fps", type=int, default=RENDER_FPS, help="render frame cap")
+    parser.add_argument("--headless", action="store_true", help="no window: tick the HUD simulation uncapped")
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks to run in --headless mode")
+    parser.add_argument("--record", metavar="PATH", help="record HUD input for deterministic replay")
+    parser.add_argument("--replay", metavar="PATH", help="no window: replay a --record file uncapped")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="record frame timings: Chrome trace JSON, or JSON lines if PATH ends in .jsonl")
+    args = parser.parse_args()
+
+    tracer = None
+    if args.trace:
+        from core.trace_recorder import TraceRecorder
+        tracer = TraceRecorder(args.trace)
+        PROFILER.set_tracer(tracer)
+    recorder = None
+    if args.record:
+        from core.replay import InputRecorder
+        recorder = InputRecorder(args.record)
+    try:
+        if args.replay:
+            import json
+            from core.replay import run
+            print(json.dumps(run(args.replay), indent=2))
+        elif args.headless:
+            import json
+            from core.headless import run
+            print(json.dumps(run(ticks=args.ticks, sim_hz=args.sim_hz), indent=2))
+        else:
+            main(sim_hz=args.sim_hz, render_fps=args.fps, recorder=recorder)
+    finally:
+        if recorder:
+            recorder.close()
+        if tracer:
+            tracer.close()
@@ -0,0 +1,59 @@
+# core/object_pool.py
+import pygame
+
+class ObjectPool:
+    """
+    Free list of reusable objects (projectiles, explosions).
+
+    acquire() hands back a released object re-initialised through its
+    reset(), or builds a new one with `factory` when the list is empty;
+    release() returns it. Objects remember the pool they came from, so
+    releasing twice, or releasing something the pool never handed out, is
+    a no-op. Up to `max_free` released objects are kept.
+    """
+    def __init__(self, factory, max_free=4096):
+        self.factory = factory
+        self.max_free = max_free
+        self.free = []
+        self.hits = 0        # acquires served from the free list
+        self.misses = 0      # acquires that had to build a new object
+        self.in_use = 0
+        self.high_water = 0  # most objects out at once
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.misses += 1
+        obj._pool = self
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        if getattr(obj, "_pool", None) is not self:
+            return
+        obj._pool = None
+        self.in_use -= 1
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "in_use": self.in_use,
+                "free": len(self.free), "high_water": self.high_water}
+
+def release(obj):
+    """Return `obj` to the pool it was acquired from, if any."""
+    pool = getattr(obj, "_pool", None)
+    if pool is not None:
+        pool.release(obj)
+
+class PooledGroup(pygame.sprite.Group):
+    """Sprite group that hands pooled sprites back when they leave it (kill, remove, empty)."""
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        release(sprite)
@@ -0,0 +1,122 @@
+# core/profiler.py
+import time, threading, collections
+
+class _NullScope:
+    __slots__ = ()
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        return False
+
+_NULL_SCOPE = _NullScope()
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+    def __init__(self, profiler, name):
+        self.profiler, self.name = profiler, name
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start, self.start)
+        return False
+
+class Profiler:
+    """
+    Named timing scopes with rolling per-frame averages.
+
+    Use `with PROFILER.scope("update.enemies"): ...`; dotted names nest in the
+    overlay. Time spent in a scope is summed over the frame (a frame may run
+    several fixed-step updates) and pushed into a rolling window by
+    end_frame(). While disabled, scope() returns a shared no-op context and
+    nothing is recorded.
+
+    A TraceRecorder attached with set_tracer() additionally receives every
+    span and counter, whether or not the overlay is enabled.
+
+    add() may be called from worker threads (service calls); the frame's
+    totals are guarded by a lock and swapped out whole by end_frame().
+    """
+    def __init__(self, window=120):
+        self.enabled = False
+        self.window = window
+        self._totals = {}                                  # this frame: name -> seconds
+        self._totals_lock = threading.Lock()
+        self._history = {}                                 # name -> deque of per-frame seconds
+        self._frames = collections.deque(maxlen=window)    # frame-to-frame seconds
+        self._last_frame = None
+        self.counters = {}
+        self.tracer = None
+
+    @property
+    def active(self):
+        return self.enabled or self.tracer is not None
+
+    def set_tracer(self, tracer):
+        self.tracer = tracer
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._last_frame = None
+        if not enabled:
+            self.reset()
+
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+
+    def reset(self):
+        with self._totals_lock:
+            self._totals = {}
+        self._history.clear()
+        self._frames.clear()
+        self.counters.clear()
+
+    def scope(self, name):
+        if not self.enabled and self.tracer is None:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name, seconds, start=None):
+        """Record time measured elsewhere (e.g. service latency) under `name`."""
+        if self.enabled:
+            with self._totals_lock:
+                self._totals[name] = self._totals.get(name, 0.0) + seconds
+        if self.tracer is not None:
+            self.tracer.complete(name, time.perf_counter() - seconds if start is None else start, seconds)
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counters[name] = value
+        if self.tracer is not None:
+            self.tracer.counter(name, value)
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            self._frames.append(now - self._last_frame)
+        self._last_frame = now
+        # take this frame's totals whole: anything added from here on counts towards the next frame
+        with self._totals_lock:
+            totals, self._totals = self._totals, {}
+        for name in totals.keys() | self._history.keys():
+            hist = self._history.get(name)
+            if hist is None:
+                hist = self._history[name] = collections.deque(maxlen=self.window)
+            hist.append(totals.get(name, 0.0))
+
+    # ───────────── read-out ─────────────
+    def averages(self):
+        """name -> average milliseconds per frame over the window."""
+        return {name: 1000.0 * sum(h) / len(h) for name, h in self._history.items() if h}
+
+    def frame_times(self):
+        """Recent frame times in milliseconds, oldest first."""
+        return [1000.0 * f for f in self._frames]
+
+    def fps(self):
+        return len(self._frames) / sum(self._frames) if self._frames and sum(self._frames) else 0.0
+
+# process-wide instance used by the game loop, screens and systems
+PROFILER = Profiler()
@@ -1,6 +1,8 @@
 # core/projectile.py
-import os, math, pygame, json, urllib.request, urllib.error, urllib.parse
+import os, math, pygame
 from core.explosion import Explosion
+from core.object_pool import ObjectPool
+from core.projectile_sprites import ProjectileSprites
 from services.damage_service import DamageService
 
 # ───────────────────────── Debug Toggle ─────────────────────────
@@ -10,19 +12,13 @@ DEBUG_PROJECTILES = False
 # Visuals are cheap (rect/line outlines) and only drawn when enabled.
 # ────────────────────────────────────────────────────────────────
 
-def _damage_from_service(projectile_type: str, distance: float, base_url: str = "http://localhost:7002") -> int:
-    try:
-        qs = urllib.parse.urlencode({"projectile_type": projectile_type, "distance": distance})
-        with urllib.request.urlopen(f"{base_url}/damage?{qs}", timeout=1.5) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            return int(data.get("damage", 10))
-    except Exception:
-        return 10  # safe fallback
-
-
 class Projectile(pygame.sprite.Sprite):
-    def __init__(self, *groups, start_pos=None, direction=None, speed=800, max_range=800, image_path=None, projectile_type="ki", owner=None, **kwargs):
+    def __init__(self, *groups, **kwargs):
         super().__init__()
+        self.reset(**kwargs)
+
+    def reset(self, start_pos=None, direction=None, speed=800, max_range=800, image_path=None, projectile_type="ki", owner=None, **kwargs):
+        # (re)initialise in place: Projectile.pool hands out killed projectiles again
         if start_pos is None or direction is None:
             raise ValueError("start_pos and direction must be provided")
         self.x, self.y = start_pos
@@ -42,23 +38,21 @@ class Projectile(pygame.sprite.Sprite):
         if image_path is None:
             image_path = os.path.join("assets", "projectiles", "default_blast.png")
 
-        if os.path.exists(image_path):
-            raw_image = pygame.image.load(image_path).convert_alpha()
-            raw_image = pygame.transform.smoothscale(raw_image, (40, 32))
-            angle = math.degrees(math.atan2(-self.dy, self.dx))
-            rotated_image = pygame.transform.rotate(raw_image, angle)
-            self.base_image = rotated_image
-            self.image = rotated_image
-            tip_offset = 12
-            shift_x = -self.dx * tip_offset
-            shift_y = -self.dy * tip_offset
+        if ProjectileSprites.exists(image_path):
+            self.image_path = image_path
+            self.angle_bucket = ProjectileSprites.angle_bucket(self.dx, self.dy)
+            self.base_image = ProjectileSprites.get(image_path, self.angle_bucket)
+            self.image = self.base_image
+            self.tip_offset = 12
+            shift_x = -self.dx * self.tip_offset
+            shift_y = -self.dy * self.tip_offset
             self.rect = self.image.get_rect(center=(self.x + shift_x, self.y + shift_y))
         else:
             self.radius = 8
+            self.tip_offset = 0
             self.is_circle = True
             self.color = (255, 220, 50)
-            self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
+            self.image = ProjectileSprites.circle(self.radius, self.color)
             self.rect = self.image.get_rect(center=(self.x, self.y))
 
         if DEBUG_PROJECTILES:
@@ -72,77 +66,86 @@ class Projectile(pygame.sprite.Sprite):
                   f"pos=({self.x:.1f},{self.y:.1f}) travelled={self.travelled:.1f}/{self.max_range}")
         self.kill()
 
-    def update(self, dt, walls_group=None, enemies_group=None, players_group=None, explosions_group=None):
+    def _sync_rect(self):
+        self.rect.center = (int(self.x - self.dx * self.tip_offset), int(self.y - self.dy * self.tip_offset))
+
+    # ───────────── outcomes (shared with the vectorized ProjectileSystem) ─────────────
+    def expire(self, explosions_group=None):
+        if explosions_group is not None:
+            explosions_group.add(Explosion.pool.acquire(self.x, self.y))
+        self._kill_with_reason("max_range")
+
+    def hit_wall(self, explosions_group=None):
+        if explosions_group is not None:
+            explosions_group.add(Explosion.pool.acquire(self.rect.centerx, self.rect.centery, 0.08))
+        self._kill_with_reason("hit_wall")
+
+    def hit_enemy(self, enemy, explosions_group=None, damage_client=None):
+        # resolved in-process by default; a remote AsyncDamageClient answers on a later tick
+        if damage_client is not None:
+            damage_client.submit(enemy, "KiBlast", self.travelled)
+            dmg = "pending"
+        else:
+            dmg = DamageService.get_damage("KiBlast", self.travelled)
+            enemy.take_damage(dmg)
+        if DEBUG_PROJECTILES:
+            print(f"[PROJ*] hit_enemy dmg={dmg} enemy={getattr(enemy,'__class__',type(enemy)).__name__} "
+                  f"pos=({self.rect.centerx},{self.rect.centery})")
+        if explosions_group is not None:
+            explosions_group.add(Explosion.pool.acquire(self.rect.centerx, self.rect.centery))
+        self._kill_with_reason("hit_enemy")
+
+    def hit_player(self, pl, explosions_group=None):
+        dist = math.hypot(self.x - self.start_pos_tuple[0], self.y - self.start_pos_tuple[1])
+        dmg = DamageService.get_damage(self.type, distance=dist)
+        pl.health -= dmg
+        if DEBUG_PROJECTILES:
+            print(f"[PROJ*] hit_player dmg={dmg} player={getattr(pl,'name','Player')} "
+                  f"pos=({self.rect.centerx},{self.rect.centery})")
+        if explosions_group is not None:
+            explosions_group.add(Explosion.pool.acquire(self.rect.centerx, self.rect.centery))
+        self._kill_with_reason("hit_player")
+
+    def update(self, dt, walls_group=None, enemies_group=None, players_group=None, explosions_group=None,
+               damage_client=None):
         dx_pixels = self.dx * self.speed * dt
         dy_pixels = self.dy * self.speed * dt
         self.x += dx_pixels
         self.y += dy_pixels
         self.travelled += math.hypot(dx_pixels, dy_pixels)
-
-        if not self.is_circle:
-            tip_offset = 12
-            shift_x = -self.dx * tip_offset
-            shift_y = -self.dy * tip_offset
-            self.rect.center = (int(self.x + shift_x), int(self.y + shift_y))
-        else:
-            self.rect.center = (int(self.x), int(self.y))
+        self._sync_rect()
 
         # range limit
         if self.travelled >= self.max_range:
-            if explosions_group is not None:
-                explosions_group.add(Explosion(self.x, self.y))
-            self._kill_with_reason("max_range")
+            self.expire(explosions_group)
             return
 
-        # wall collisions
-        if walls_group:
-            for wall in walls_group:
-                if self.rect.colliderect(wall.rect):
-                    if explosions_group is not None:
-                        explosions_group.add(Explosion(self.rect.centerx, self.rect.centery, 0.08))
-                    self._kill_with_reason("hit_wall")
-                    return
+        # wall collisions (walls_group is the map's collision index)
+        if walls_group and walls_group.collides(self.rect):
+            self.hit_wall(explosions_group)
+            return
 
         # enemy collisions (only for player-fired shots)
         if enemies_group and not self.from_enemy:
-            hit = pygame.sprite.spritecollide(self, enemies_group, False)
-            for enemy in hit:
-                # call damage microservice
-                import json, urllib.request, urllib.parse
-                try:
-                    qs = urllib.parse.urlencode({
-                        "projectile_type": "KiBlast",
-                        "distance": float(self.travelled)
-                    })
-                    with urllib.request.urlopen(f"http://localhost:7002/damage?{qs}", timeout=1.5) as resp:
-                        data = json.loads(resp.read().decode("utf-8"))
-                        dmg = int(data.get("damage", 10))
-                except Exception:
-                    dmg = 10
-                enemy.take_damage(dmg)
-                if DEBUG_PROJECTILES:
-                    print(f"[PROJ*] hit_enemy dmg={dmg} enemy={getattr(enemy,'__class__',type(enemy)).__name__} "
-                          f"pos=({self.rect.centerx},{self.rect.centery})")
-                if explosions_group is not None:
-                    explosions_group.add(Explosion(self.rect.centerx, self.rect.centery))
-                self._kill_with_reason("hit_enemy")
+            hit = self._first_hit(enemies_group)
+            if hit is not None:
+                self.hit_enemy(hit, explosions_group, damage_client)
                 return
 
         # player collisions (only for enemy-fired shots)
         if players_group and self.from_enemy:
-            hit_players = pygame.sprite.spritecollide(self, players_group, False)
-            for pl in hit_players:
-                dist = math.hypot(self.x - self.start_pos_tuple[0], self.y - self.start_pos_tuple[1])
-                dmg = DamageService.get_damage(self.type, distance=dist)
-                pl.health -= dmg
-                if DEBUG_PROJECTILES:
-                    print(f"[PROJ*] hit_player dmg={dmg} player={getattr(pl,'name','Player')} "
-                          f"pos=({self.rect.centerx},{self.rect.centery})")
-                if explosions_group is not None:
-                    explosions_group.add(Explosion(self.rect.centerx, self.rect.centery))
-                self._kill_with_reason("hit_player")
+            hit = self._first_hit(players_group)
+            if hit is not None:
+                self.hit_player(hit, explosions_group)
                 return
 
+    def _first_hit(self, actors):
+        # actors: a per-tick SpatialHash (ProjectileSystem) or a plain sprite group
+        if hasattr(actors, "first_hit"):
+            return actors.first_hit(self.rect)
+        hit = pygame.sprite.spritecollide(self, actors, False)
+        return hit[0] if hit else None
+
     def _debug_draw(self, screen, screen_x, screen_y, zoom):
         # Draw a small direction line and an outline around the sprite/circle
         try:
@@ -158,7 +161,7 @@ class Projectile(pygame.sprite.Sprite):
                 pygame.draw.circle(screen, (255, 255, 255), (screen_x, screen_y), radius, 1)
             else:
                 # approximate outline using current image rect
-                scaled_image = pygame.transform.rotozoom(self.base_image, 0, zoom)
+                scaled_image = ProjectileSprites.get(self.image_path, self.angle_bucket, zoom)
                 rect = scaled_image.get_rect(center=(screen_x, screen_y))
                 pygame.draw.rect(screen, (255, 255, 255), rect, 1)
         except Exception:
@@ -172,9 +175,12 @@ class Projectile(pygame.sprite.Sprite):
             radius = max(1, int(self.radius * zoom))
             pygame.draw.circle(screen, self.color, (screen_x, screen_y), radius)
         else:
-            scaled_image = pygame.transform.rotozoom(self.base_image, 0, zoom)
+            scaled_image = ProjectileSprites.get(self.image_path, self.angle_bucket, zoom)
             rect = scaled_image.get_rect(center=(screen_x, screen_y))
             screen.blit(scaled_image, rect)
 
         if DEBUG_PROJECTILES:
             self._debug_draw(screen, screen_x, screen_y, zoom)
+
+# shared by every shooter; ProjectileSystem returns killed projectiles to it
+Projectile.pool = ObjectPool(Projectile)
@@ -0,0 +1,66 @@
+# core/projectile_sprites.py
+import os, math, pygame
+from core.camera import Camera
+from core.asset_manager import AssetManager
+
+class ProjectileSprites:
+    """
+    Registry of projectile images, loaded once per path.
+
+    Each image is scaled to SIZE and pre-rotated into ANGLE_BUCKETS directions
+    for every camera zoom, so creating or drawing a projectile never touches
+    the disk or allocates a new Surface.
+    """
+    SIZE = (40, 32)
+    ANGLE_BUCKETS = 64
+    _variants = {}   # path -> {(bucket, zoom): Surface} or None if missing
+    _circles = {}    # (radius, color) -> Surface
+
+    @classmethod
+    def angle_bucket(cls, dx, dy):
+        angle = math.degrees(math.atan2(-dy, dx))
+        return round(angle * cls.ANGLE_BUCKETS / 360.0) % cls.ANGLE_BUCKETS
+
+    @classmethod
+    def _load(cls, path):
+        if path not in cls._variants:
+            if not os.path.exists(AssetManager.resolve(path)):
+                cls._variants[path] = None
+            else:
+                raw = AssetManager.image(path)
+                raw = pygame.transform.smoothscale(raw, cls.SIZE)
+                variants = {}
+                for bucket in range(cls.ANGLE_BUCKETS):
+                    rotated = pygame.transform.rotate(raw, bucket * 360.0 / cls.ANGLE_BUCKETS)
+                    variants[(bucket, 1.0)] = rotated
+                    for zoom in Camera.ALLOWED_ZOOMS:
+                        if zoom != 1.0:
+                            variants[(bucket, zoom)] = pygame.transform.rotozoom(rotated, 0, zoom)
+                cls._variants[path] = variants
+        return cls._variants[path]
+
+    @classmethod
+    def exists(cls, path):
+        return cls._load(path) is not None
+
+    @classmethod
+    def get(cls, path, bucket, zoom=1.0):
+        variants = cls._load(path)
+        if variants is None:
+            return None
+        img = variants.get((bucket, zoom))
+        if img is None:
+            # zoom outside Camera.ALLOWED_ZOOMS: build once and keep it
+            img = pygame.transform.rotozoom(variants[(bucket, 1.0)], 0, zoom)
+            variants[(bucket, zoom)] = img
+        return img
+
+    @classmethod
+    def circle(cls, radius, color):
+        key = (radius, color)
+        img = cls._circles.get(key)
+        if img is None:
+            img = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(img, color, (radius, radius), radius)
+            cls._circles[key] = img
+        return img
@@ -0,0 +1,226 @@
+# core/replay.py
+"""
+Deterministic input recording for HUDScreen.
+
+A recording is a gzip stream: a header (seed, sim rate, player race/name)
+followed by one record per simulation tick holding the watched key state,
+the input events the HUD consumed and any spawn-service enemies applied that
+tick. Replaying it through the HUD at the same fixed dt reproduces the run.
+Damage is resolved locally during replay (the async damage service is not
+deterministic).
+"""
+import os, sys, time, gzip, json, zlib, struct, argparse
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pygame
+
+MAGIC, VERSION = b"KGRP", 1
+
+# keys the simulation polls every tick, stored as a bitmask (extend at the end only)
+WATCHED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+                pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+                pygame.K_q, pygame.K_SPACE)
+
+_HEADER = struct.Struct("<4sHqHB")   # magic, version, seed, sim_hz, player_given
+_KEY    = struct.Struct("<BIHB")     # kind, key, mod, len(unicode)
+_BUTTON = struct.Struct("<BhhB")     # kind, x, y, button
+_MOTION = struct.Struct("<BhhhhB")   # kind, x, y, rel x, rel y, buttons
+_SPAWN  = struct.Struct("<ii")
+
+# tick flags
+_KEYS_CHANGED, _HAS_EVENTS, _HAS_SPAWNS = 1, 2, 4
+
+# event kinds
+_KINDS = {pygame.KEYDOWN: 1, pygame.KEYUP: 2, pygame.MOUSEBUTTONDOWN: 3,
+          pygame.MOUSEBUTTONUP: 4, pygame.MOUSEMOTION: 5}
+_TYPES = {kind: ev_type for ev_type, kind in _KINDS.items()}
+
+class KeyState:
+    """Stands in for pygame.key.get_pressed(): indexable by key constant."""
+    __slots__ = ("pressed",)
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+    def __getitem__(self, key):
+        return key in self.pressed
+
+def _key_mask(keys):
+    mask = 0
+    for bit, key in enumerate(WATCHED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+def _mask_keys(mask):
+    return KeyState(key for bit, key in enumerate(WATCHED_KEYS) if mask >> bit & 1)
+
+def _write_str(f, text):
+    data = text.encode("utf-8")[:255]
+    f.write(bytes((len(data),)) + data)
+
+def _read_exact(f, n):
+    data = f.read(n)
+    if len(data) < n:
+        raise EOFError
+    return data
+
+def _read_str(f):
+    return _read_exact(f, _read_exact(f, 1)[0]).decode("utf-8")
+
+class InputRecorder:
+    """Writes one record per HUD tick. start() (re)opens the file for a new HUD session."""
+    def __init__(self, path):
+        self.path = path
+        self.ticks = 0
+        self._file = None
+        self._mask = 0
+
+    def start(self, seed, sim_hz, race="Shiba", name="Player", player_given=False):
+        self.close()
+        self._file = gzip.open(self.path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed, sim_hz, int(player_given)))
+        _write_str(self._file, race)
+        _write_str(self._file, name)
+        self.ticks, self._mask = 0, 0
+
+    def write_tick(self, keys, events, spawns=None):
+        if self._file is None:
+            return
+        mask = _key_mask(keys)
+        recorded = [ev for ev in events if ev.type in _KINDS]
+        flags = ((_KEYS_CHANGED if mask != self._mask else 0) |
+                 (_HAS_EVENTS if recorded else 0) |
+                 (_HAS_SPAWNS if spawns else 0))
+        out = bytearray((flags,))
+        if flags & _KEYS_CHANGED:
+            out += struct.pack("<H", mask)
+            self._mask = mask
+        if recorded:
+            out.append(min(len(recorded), 255))
+            for ev in recorded[:255]:
+                kind = _KINDS[ev.type]
+                if kind <= 2:
+                    text = getattr(ev, "unicode", "").encode("utf-8")[:255]
+                    out += _KEY.pack(kind, ev.key, ev.mod & 0xFFFF, len(text)) + text
+                elif kind <= 4:
+                    out += _BUTTON.pack(kind, ev.pos[0], ev.pos[1], ev.button)
+                else:
+                    buttons = sum(1 << i for i, b in enumerate(ev.buttons[:8]) if b)
+                    out += _MOTION.pack(kind, ev.pos[0], ev.pos[1], ev.rel[0], ev.rel[1], buttons)
+        if spawns:
+            spawns = list(spawns)[:255]
+            out.append(len(spawns))
+            for (x, y) in spawns:
+                out += _SPAWN.pack(int(x), int(y))
+        self._file.write(out)
+        self.ticks += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class InputReplay:
+    """Reads a recording; iterate ticks() for (KeyState, events, spawns) per tick."""
+    def __init__(self, path):
+        self.path = path
+        with gzip.open(path, "rb") as f:
+            magic, version, self.seed, self.sim_hz, player_given = _HEADER.unpack(_read_exact(f, _HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a version {VERSION} input recording")
+            self.player_given = bool(player_given)
+            self.race = _read_str(f)
+            self.name = _read_str(f)
+
+    def ticks(self):
+        with gzip.open(self.path, "rb") as f:
+            _read_exact(f, _HEADER.size)
+            _read_str(f); _read_str(f)
+            keys = KeyState()
+            while True:
+                try:
+                    head = f.read(1)
+                    if not head:
+                        return
+                    flags = head[0]
+                    if flags & _KEYS_CHANGED:
+                        keys = _mask_keys(struct.unpack("<H", _read_exact(f, 2))[0])
+                    events = []
+                    if flags & _HAS_EVENTS:
+                        for _ in range(_read_exact(f, 1)[0]):
+                            events.append(self._read_event(f))
+                    spawns = None
+                    if flags & _HAS_SPAWNS:
+                        spawns = [_SPAWN.unpack(_read_exact(f, _SPAWN.size)) for _ in range(_read_exact(f, 1)[0])]
+                except EOFError:
+                    return  # recording cut short (e.g. the game crashed): replay what is there
+                yield keys, events, spawns
+
+    @staticmethod
+    def _read_event(f):
+        kind = _read_exact(f, 1)[0]
+        if kind <= 2:
+            _, key, mod, n = _KEY.unpack(bytes((kind,)) + _read_exact(f, _KEY.size - 1))
+            return pygame.event.Event(_TYPES[kind], key=key, mod=mod, unicode=_read_exact(f, n).decode("utf-8"))
+        if kind <= 4:
+            _, x, y, button = _BUTTON.unpack(bytes((kind,)) + _read_exact(f, _BUTTON.size - 1))
+            return pygame.event.Event(_TYPES[kind], pos=(x, y), button=button)
+        if kind == 5:
+            _, x, y, rx, ry, buttons = _MOTION.unpack(bytes((kind,)) + _read_exact(f, _MOTION.size - 1))
+            return pygame.event.Event(_TYPES[kind], pos=(x, y), rel=(rx, ry),
+                                      buttons=tuple(buttons >> i & 1 for i in range(3)))
+        raise ValueError(f"unknown event kind {kind}")
+
+def state_hash(hud):
+    """CRC of the simulation state, for checking two replays ended identically."""
+    state = [tuple(hud.player.rect), hud.player.health, hud.player.energy]
+    state += sorted((tuple(e.rect), e.health) for e in hud.enemies)
+    return zlib.crc32(repr(state).encode("utf-8"))
+
+def run(path):
+    """Replay a recording headlessly as fast as possible; returns per-tick timing stats."""
+    from core.headless import init_headless, make_hud
+    from core.profiler import PROFILER
+    from entities.player import Player
+
+    os.environ.pop("DAMAGE_SERVICE_URL", None)  # remote damage lands on nondeterministic ticks
+    replay = InputReplay(path)
+    screen = init_headless()
+    player = Player(0, 0, race=replay.race, name=replay.name) if replay.player_given else None
+    dt = 1.0 / replay.sim_hz
+    hud = make_hud(screen, fixed_dt=dt, player=player, seed=replay.seed, fetch_spawns=False).current_screen
+
+    samples = []
+    start = time.perf_counter()
+    for keys, events, spawns in replay.ticks():
+        if spawns:
+            hud._pending_spawns = spawns
+        t = time.perf_counter()
+        with PROFILER.scope("update"):
+            hud.update(dt, events, keys)
+        samples.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+
+    samples.sort()
+    pick = lambda q: 1000.0 * samples[min(len(samples) - 1, int(q * len(samples)))] if samples else 0.0
+    return {
+        "ticks": len(samples),
+        "sim_hz": replay.sim_hz,
+        "seed": replay.seed,
+        "wall_seconds": elapsed,
+        "ticks_per_second": len(samples) / elapsed if elapsed else float("inf"),
+        "tick_p50_ms": pick(0.50),
+        "tick_p99_ms": pick(0.99),
+        "tick_max_ms": pick(1.0),
+        "enemies": len(hud.enemies),
+        "state_hash": state_hash(hud),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded HUD session headless, uncapped")
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1, help="replay N times (state_hash should match)")
+    args = parser.parse_args()
+    recording = os.path.abspath(args.recording)
+    # asset/config paths are relative to the project root
+    os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    for _ in range(args.repeat):
+        print(json.dumps(run(recording), indent=2))
@@ -0,0 +1,59 @@
+# core/spatial_grid.py
+import pygame
+
+class SpatialGrid:
+    """
+    Uniform-grid index over static collision rectangles.
+
+    Built once from the map's collision objects; each rect is bucketed into
+    every cell it overlaps, so a query only tests the rects near it instead
+    of the whole list. Iterating the grid yields the original rects.
+    """
+    def __init__(self, rects, cell_size=128):
+        self.cell_size = cell_size
+        self.rects = [pygame.Rect(r) for r in rects]
+        self.cells = {}
+        for i, r in enumerate(self.rects):
+            for key in self._cells_for(r):
+                self.cells.setdefault(key, []).append(i)
+
+    def _cells_for(self, rect):
+        cs = self.cell_size
+        x0, y0 = rect.left // cs, rect.top // cs
+        x1 = max(rect.right - 1, rect.left) // cs
+        y1 = max(rect.bottom - 1, rect.top) // cs
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield (cx, cy)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def query_rect(self, rect):
+        """All indexed rects overlapping `rect`."""
+        rect = pygame.Rect(rect)
+        seen, hits = set(), []
+        for key in self._cells_for(rect):
+            for i in self.cells.get(key, ()):
+                if i not in seen:
+                    seen.add(i)
+                    if rect.colliderect(self.rects[i]):
+                        hits.append(self.rects[i])
+        return hits
+
+    def collides(self, rect):
+        """True if `rect` overlaps any indexed rect."""
+        rect = pygame.Rect(rect)
+        for key in self._cells_for(rect):
+            for i in self.cells.get(key, ()):
+                if rect.colliderect(self.rects[i]):
+                    return True
+        return False
+
+    @classmethod
+    def ensure(cls, rects):
+        # anything already exposing collides() (a grid or CollisionBitmap) is used as-is
+        return rects if hasattr(rects, "collides") else cls(rects or [])
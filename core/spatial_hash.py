@@ -0,0 +1,134 @@
+# core/spatial_hash.py
+try:
+    import numpy as np
+except ImportError:  # pairs() needs NumPy; first_hit() does not
+    np = None
+
+class SpatialHash:
+    """
+    Uniform-grid hash over moving sprites, rebuilt once per tick.
+
+    SpatialGrid indexes the static map; this is its dynamic counterpart for
+    the projectile broad phase. rebuild() takes the tick's sprites (optionally
+    only those inside `bounds`, e.g. the box around all live shots), which
+    the first query buckets by the cells their rects overlap; queries then
+    only test the sprites sharing a cell. Sprites keep their insertion order,
+    so results match spritecollide against the same group, and sprites killed
+    since the rebuild are skipped.
+    """
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.sprites = []
+        self.bounds = None
+        self.cells = None
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def _cells_for(self, rect):
+        cs = self.cell_size
+        for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                yield (cx, cy)
+
+    def rebuild(self, sprites, bounds=None):
+        """Takes this tick's sprites; the buckets are built by the first query."""
+        self.sprites = list(sprites)
+        self.bounds = bounds
+        self.cells = None
+        self._arrays = None
+
+    def _build_cells(self):
+        cs, bounds, cells = self.cell_size, self.bounds, {}
+        for i, s in enumerate(self.sprites):
+            r = s.rect
+            if bounds is not None and not bounds.colliderect(r):
+                continue
+            for cy in range(r.top // cs, (r.bottom - 1) // cs + 1):
+                for cx in range(r.left // cs, (r.right - 1) // cs + 1):
+                    if (cx, cy) in cells:
+                        cells[(cx, cy)].append(i)
+                    else:
+                        cells[(cx, cy)] = [i]
+        self.cells = cells
+        return cells
+
+    def first_hit(self, rect):
+        """The earliest-inserted live sprite overlapping `rect`, or None."""
+        cells = self.cells if self.cells is not None else self._build_cells()
+        sprites, best = self.sprites, None
+        for key in self._cells_for(rect):
+            for i in cells.get(key, ()):
+                if (best is None or i < best) and rect.colliderect(sprites[i].rect) and sprites[i].alive():
+                    best = i
+        return None if best is None else sprites[best]
+
+    # ───────────── vectorized join (NumPy) ─────────────
+    def _build_arrays(self):
+        # (cell key, sprite index) rows sorted by key, plus every sprite's rect
+        cs = self.cell_size
+        rects = np.array([tuple(s.rect) for s in self.sprites], dtype=np.int64).reshape(-1, 4)
+        x, y, w, h = rects.T
+        inside = (w > 0) & (h > 0)
+        if self.bounds is not None:
+            b = self.bounds
+            inside &= (x < b.right) & (x + w > b.left) & (y < b.bottom) & (y + h > b.top)
+        idx = np.flatnonzero(inside)
+        x0, y0 = x[idx] // cs, y[idx] // cs
+        nx, ny = (x[idx] + w[idx] - 1) // cs - x0 + 1, (y[idx] + h[idx] - 1) // cs - y0 + 1
+        keys, owners = [], []
+        for oy in range(int(ny.max(initial=0))):
+            for ox in range(int(nx.max(initial=0))):
+                sel = (ox < nx) & (oy < ny)
+                keys.append(self._key(x0[sel] + ox, y0[sel] + oy))
+                owners.append(idx[sel])
+        keys = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        owners = np.concatenate(owners) if owners else np.zeros(0, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        self._arrays = (keys[order], owners[order], rects)
+        return self._arrays
+
+    @staticmethod
+    def _key(cx, cy):
+        return (cx + (1 << 20)) * (1 << 21) + (cy + (1 << 20))
+
+    def pairs(self, lefts, tops, widths, heights):
+        """
+        Every (rect index, sprite index) whose rects overlap, for NumPy arrays
+        of query rects. Sorted by sprite, then rect, so resolving them in order
+        visits each sprite's hits the way a per-sprite scan would.
+        """
+        empty = np.zeros(0, dtype=np.int64)
+        if not self.sprites or len(lefts) == 0:
+            return empty, empty
+        keys, owners, rects = self._arrays or self._build_arrays()
+        cs = self.cell_size
+        l, t = np.asarray(lefts, dtype=np.int64), np.asarray(tops, dtype=np.int64)
+        w, h = np.asarray(widths, dtype=np.int64), np.asarray(heights, dtype=np.int64)
+        cx0, cy0 = l // cs, t // cs
+        cx1, cy1 = (l + np.maximum(w, 1) - 1) // cs, (t + np.maximum(h, 1) - 1) // cs
+        found_q, found_s = [], []
+        for oy in range(int((cy1 - cy0).max()) + 1):
+            for ox in range(int((cx1 - cx0).max()) + 1):
+                q = np.flatnonzero((cx0 + ox <= cx1) & (cy0 + oy <= cy1))
+                qkeys = self._key(cx0[q] + ox, cy0[q] + oy)
+                start = np.searchsorted(keys, qkeys, "left")
+                count = np.searchsorted(keys, qkeys, "right") - start
+                total = int(count.sum())
+                if total == 0:
+                    continue
+                # expand each query rect into one row per sprite in its cell
+                base = np.repeat(start - np.cumsum(count) + count, count)
+                found_q.append(np.repeat(q, count))
+                found_s.append(owners[base + np.arange(total)])
+        if not found_q:
+            return empty, empty
+        qi, si = np.concatenate(found_q), np.concatenate(found_s)
+        # a pair can share several cells: dedupe (this also sorts sprite-major)
+        pair = np.unique(si * len(l) + qi)
+        si, qi = pair // len(l), pair % len(l)
+        r = rects[si]
+        hit = ((l[qi] < r[:, 0] + r[:, 2]) & (l[qi] + w[qi] > r[:, 0]) &
+               (t[qi] < r[:, 1] + r[:, 3]) & (t[qi] + h[qi] > r[:, 1]) & (w[qi] > 0) & (h[qi] > 0))
+        return qi[hit], si[hit]
@@ -0,0 +1,84 @@
+# core/trace_recorder.py
+import os, json, time, threading, collections
+
+class TraceRecorder:
+    """
+    Streams profiler spans and counters to disk for offline analysis.
+
+    Events go into a bounded ring buffer on the game thread and are written by
+    a background thread, so a slow disk never stalls a frame (if the writer
+    falls behind, the oldest events are dropped and counted in `dropped`).
+
+    Formats, picked from the file extension unless `fmt` is given:
+      - "chrome": Trace Event JSON array, opens in chrome://tracing / Perfetto.
+        The array is streamed, so a file cut short by a crash still loads.
+      - "jsonl":  one event object per line, for scripts.
+    """
+    def __init__(self, path, fmt=None, capacity=65536, flush_interval=0.25):
+        self.path = path
+        self.fmt = fmt or ("jsonl" if path.endswith(".jsonl") else "chrome")
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._buffer = collections.deque(maxlen=capacity)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._stop = threading.Event()
+
+        self._file = open(path, "w", encoding="utf-8")
+        if self.fmt == "chrome":
+            self._file.write("[\n")
+        self._thread = threading.Thread(target=self._writer, name="trace-writer", daemon=True)
+        self._thread.start()
+
+    # ───────────── recording (game thread) ─────────────
+    def _push(self, event):
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(event)
+
+    def complete(self, name, start, duration):
+        """A span that began at perf_counter() `start` and lasted `duration` seconds."""
+        self._push(("X", name, start, duration, threading.get_ident()))
+
+    def counter(self, name, value):
+        self._push(("C", name, time.perf_counter(), value, 0))
+
+    def instant(self, name):
+        self._push(("i", name, time.perf_counter(), None, threading.get_ident()))
+
+    # ───────────── writing (background thread) ─────────────
+    def _format(self, event):
+        ph, name, t, value, tid = event
+        out = {"name": name, "ph": ph, "ts": round((t - self._origin) * 1e6, 1), "pid": self._pid, "tid": tid}
+        if ph == "X":
+            out["dur"] = round(value * 1e6, 1)
+            out["cat"] = name.split(".", 1)[0]
+        elif ph == "C":
+            out["args"] = {"value": value}
+        else:
+            out["s"] = "t"
+        return out
+
+    def _drain(self):
+        sep = ",\n" if self.fmt == "chrome" else "\n"
+        lines = []
+        while self._buffer:
+            lines.append(json.dumps(self._format(self._buffer.popleft())) + sep)
+        if lines:
+            self._file.writelines(lines)
+            self._file.flush()
+
+    def _writer(self):
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._drain()
+        if self.fmt == "chrome":
+            meta = {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "kagetsu_no_shiba"}}
+            self._file.write(json.dumps(meta) + "\n]\n")
+        self._file.close()
@@ -2,6 +2,9 @@
 import os, random, math, pygame
 from typing import Optional
 from core.projectile import Projectile
+from core.frame_cache import FrameCache
+from core.asset_manager import AssetManager
+from core.spatial_grid import SpatialGrid
 from entities.player import Player
 
 # tunables
@@ -12,27 +15,25 @@ class Enemy(pygame.sprite.Sprite):
     FRAME_WIDTH, FRAME_HEIGHT, FRAMES_PER_DIR = 32, 64, 6
     DIRECTIONS = ["right", "up", "left", "down"]
     projectile_group: Optional[pygame.sprite.Group] = None
+    deaths = 0  # kill() calls so far; HordeEnemyController re-syncs with its group when this moves
 
     def __init__(self, x, y, speed=80, max_health=60):
         super().__init__()
         self.projectile_group: Optional[pygame.sprite.Group] = None
-        root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        run_path  = os.path.join(root, "assets", "characters", "enemies", "run_horizontal_32x32_2.png")
-        idle_path = os.path.join(root, "assets", "characters", "enemies", "idle_32x32_2.png")
+        run_path  = os.path.join("assets", "characters", "enemies", "run_horizontal_32x32_2.png")
+        idle_path = os.path.join("assets", "characters", "enemies", "idle_32x32_2.png")
 
-        self.run_sheet  = pygame.image.load(run_path).convert_alpha()
-        self.idle_sheet = pygame.image.load(idle_path).convert_alpha()
+        # decoded sheets and frame slices are shared by every Enemy
+        self.run_sheet  = AssetManager.image(run_path)
+        self.idle_sheet = AssetManager.image(idle_path)
 
         self.animations = {
-            d: [self.run_sheet.subsurface(
-                    pygame.Rect((row*self.FRAMES_PER_DIR + i)*self.FRAME_WIDTH, 0,
-                                self.FRAME_WIDTH, self.FRAME_HEIGHT)).copy()
-                for i in range(self.FRAMES_PER_DIR)]
+            d: AssetManager.frames(run_path, self.FRAME_WIDTH, self.FRAME_HEIGHT, self.FRAMES_PER_DIR,
+                                   start=row*self.FRAMES_PER_DIR)
             for row, d in enumerate(self.DIRECTIONS)
         }
         self.idles = {
-            d: self.idle_sheet.subsurface(
-                    pygame.Rect(row*self.FRAME_WIDTH, 0, self.FRAME_WIDTH, self.FRAME_HEIGHT)).copy()
+            d: AssetManager.frames(idle_path, self.FRAME_WIDTH, self.FRAME_HEIGHT, 1, start=row)[0]
             for row, d in enumerate(self.DIRECTIONS)
         }
 
@@ -51,13 +52,14 @@ class Enemy(pygame.sprite.Sprite):
         self.health = self.max_health = max_health
 
         # sprite & rect
-        self.image = self.idles[self.direction]
+        self._set_frame(False)
         self.rect  = self.image.get_rect(center=(x, y))
 
 
     # ─────────── main update ────────────
-    def update(self, dt, player, collision_rects=None, map_rect=None):
+    def update(self, dt, player, collision_rects=None, map_rect=None, flow_field=None):
         self.shoot_timer += dt
+        collision_rects = SpatialGrid.ensure(collision_rects)
         px, py = player.rect.center
         dist   = math.hypot(px - self.rect.centerx, py - self.rect.centery)
 
@@ -69,9 +71,9 @@ class Enemy(pygame.sprite.Sprite):
         if self.state == "patrol":
             moved = self._patrol(dt, collision_rects, map_rect)
         elif self.state == "chase":
-            moved = self._chase(dt, px, py, collision_rects, map_rect, self.speed)
+            moved = self._chase(dt, px, py, collision_rects, map_rect, self.speed, flow_field)
         else:  # attack
-            moved = self._chase(dt, px, py, collision_rects, map_rect, self.speed)
+            moved = self._chase(dt, px, py, collision_rects, map_rect, self.speed, flow_field)
             self._shoot(player)  # now passes full Player object
 
         self._animate(dt, moved)
@@ -85,7 +87,12 @@ class Enemy(pygame.sprite.Sprite):
         vx, vy = self.dir_vec[self.direction]
         return self._move(vx*PATROL_SPEED*dt, vy*PATROL_SPEED*dt, collision_rects, map_rect)
 
-    def _chase(self, dt, tx, ty, collision_rects, map_rect, speed):
+    def _chase(self, dt, tx, ty, collision_rects, map_rect, speed, flow_field=None):
+        # route around walls via the shared flow field; straight at the target once close
+        if flow_field is not None:
+            step = flow_field.step_toward(*self.rect.center)
+            if step is not None:
+                tx, ty = step
         dx, dy = tx - self.rect.centerx, ty - self.rect.centery
         dist   = math.hypot(dx, dy)
        
@@ -121,8 +128,8 @@ class Enemy(pygame.sprite.Sprite):
             self.y -= dy  # undo
             self.rect.centery = int(self.y)
 
-        # Clamp to map
-        if map_rect:
+        # Clamp to map (only when outside, so sub-pixel progress in x/y is kept)
+        if map_rect and not map_rect.contains(self.rect):
             self.rect.clamp_ip(map_rect)
             self.x, self.y = float(self.rect.centerx), float(self.rect.centery)
 
@@ -131,7 +138,7 @@ class Enemy(pygame.sprite.Sprite):
 
 
     def _free(self, rect, tiles):  # collision helper
-        return (not tiles) or all(not rect.colliderect(t) for t in tiles)
+        return (not tiles) or not tiles.collides(rect)
 
     # ───────────── shooting ─────────────
     def _shoot(self, player: "Player"):
@@ -142,7 +149,7 @@ class Enemy(pygame.sprite.Sprite):
         dy = player.rect.centery - self.rect.centery
         length = max(math.hypot(dx, dy), 1e-6)
         direction = (dx / length, dy / length)
-        bullet = Projectile(
+        bullet = Projectile.pool.acquire(
             start_pos=self.rect.center,
             direction=direction,
             speed=PROJECTILE_SPEED,
@@ -153,28 +160,39 @@ class Enemy(pygame.sprite.Sprite):
         self.projectile_group.add(bullet)
 
     # ───────────── visuals ──────────────
+    def _set_frame(self, running):
+        # frame_key identifies the frame in the shared FrameCache
+        if running:
+            self.image = self.animations[self.direction][self.frame_index]
+            self.frame_key = ("enemy_run", self.direction, self.frame_index)
+        else:
+            self.image = self.idles[self.direction]
+            self.frame_key = ("enemy_idle", self.direction, 0)
+
     def _animate(self, dt, moved):
         if moved:
             self.frame_timer += dt
             if self.frame_timer >= 0.15:
                 self.frame_timer = 0.0
                 self.frame_index = (self.frame_index + 1) % len(self.animations[self.direction])
-            self.image = self.animations[self.direction][self.frame_index]
+            self._set_frame(True)
         else:
             self.frame_index = 0
-            self.image = self.idles[self.direction]
+            self._set_frame(False)
 
     def take_damage(self, dmg):  # called by ProjectileSystem
         self.health -= dmg
         if self.health <= 0:
             self.kill()
 
+    def kill(self):
+        Enemy.deaths += 1
+        super().kill()
+
     def draw(self, surface, camera):
         zoom = camera.zoom
         rs   = camera.apply(self.rect)
-        img  = pygame.transform.scale(self.image,
-                                      (int(self.image.get_width()*zoom),
-                                       int(self.image.get_height()*zoom)))
+        img  = FrameCache.get(self.frame_key, self.image, zoom)
         ir   = img.get_rect(center=rs.center)
         surface.blit(img, ir)
         # hp bar
@@ -1,6 +1,9 @@
 import os
 import pygame
 from core.projectile import Projectile
+from core.frame_cache import FrameCache
+from core.asset_manager import AssetManager
+from core.spatial_grid import SpatialGrid
 from services.race_service import RaceService
 
 class Player(pygame.sprite.Sprite):
@@ -10,19 +13,21 @@ class Player(pygame.sprite.Sprite):
     DIRECTIONS = ["right", "up", "left", "down"]
 
     def __init__(self, x, y, race="Shiba", **kwargs):
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        run_path = os.path.join(project_root, "assets", "characters", "players", "run_horizontal_32x32_2.png")
-        idle_path = os.path.join(project_root, "assets", "characters", "players", "idle_32x32_2.png")
+        run_path = os.path.join("assets", "characters", "players", "run_horizontal_32x32_2.png")
+        idle_path = os.path.join("assets", "characters", "players", "idle_32x32_2.png")
 
-        self.run_sheet = pygame.image.load(run_path).convert_alpha()
-        self.idle_sheet = pygame.image.load(idle_path).convert_alpha()
+        # decoded sheets and trimmed frames are shared by every Player
+        self.run_sheet = AssetManager.image(run_path)
+        self.idle_sheet = AssetManager.image(idle_path)
 
         self.animations = {
-            dir_name: self._load_frames(row_idx)
+            dir_name: AssetManager.frames(run_path, self.FRAME_WIDTH, self.FRAME_HEIGHT, self.FRAMES_PER_DIR,
+                                          start=row_idx * self.FRAMES_PER_DIR, trim=True)
             for row_idx, dir_name in enumerate(self.DIRECTIONS)
         }
         self.idles = {
-            dir_name: self._load_idle(idx)
+            dir_name: AssetManager.frames(idle_path, self.FRAME_WIDTH, self.FRAME_HEIGHT, 1,
+                                          start=idx, trim=True)[0]
             for idx, dir_name in enumerate(self.DIRECTIONS)
         }
 
@@ -30,7 +35,7 @@ class Player(pygame.sprite.Sprite):
         self.frame_index = 0
         self.frame_timer = 0
         self.frame_duration = 0.12
-        self.image = self.idles[self.direction]
+        self.set_frame(False, self.direction)
 
         hitbox_width = 20
         hitbox_height = 28
@@ -79,30 +84,19 @@ class Player(pygame.sprite.Sprite):
         spawn_y = sprite_top + int(sprite_height * 0.6)
         return (center_x, spawn_y)
 
-    def _trim_surface(self, surface):
-        mask = pygame.mask.from_surface(surface)
-        rects = mask.get_bounding_rects()
-        if rects:
-            return surface.subsurface(rects[0])
-        return surface
-
-    def _load_frames(self, direction_index):
-        start = direction_index * self.FRAMES_PER_DIR
-        return [
-            self._trim_surface(self.run_sheet.subsurface(
-                pygame.Rect((start + i) * self.FRAME_WIDTH, 0, self.FRAME_WIDTH, self.FRAME_HEIGHT)
-            ))
-            for i in range(self.FRAMES_PER_DIR)
-        ]
-
-    def _load_idle(self, index):
-        return self._trim_surface(self.idle_sheet.subsurface(
-            pygame.Rect(index * self.FRAME_WIDTH, 0, self.FRAME_WIDTH, self.FRAME_HEIGHT)
-        ))
+    def set_frame(self, running, direction, index=0):
+        # frame_key identifies the frame in the shared FrameCache
+        if running:
+            self.image = self.animations[direction][index]
+            self.frame_key = ("player_run", direction, index)
+        else:
+            self.image = self.idles[direction]
+            self.frame_key = ("player_idle", direction, 0)
 
     def update(self, keys, dt, map_rect, collision_rects, override_animation=False):
         dx = dy = 0
         moving = False
+        collision_rects = SpatialGrid.ensure(collision_rects)
 
         if keys[pygame.K_w] or keys[pygame.K_UP]:
             dy, self.direction, moving = -self.speed * dt, "up", True
@@ -120,12 +114,12 @@ class Player(pygame.sprite.Sprite):
 
         # Horizontal movement
         next_rect = self.rect.move(dx, 0)
-        if not any(next_rect.colliderect(r) for r in collision_rects):
+        if not collision_rects.collides(next_rect):
             self.rect.x += dx
 
         # Vertical movement
         next_rect = self.rect.move(0, dy)
-        if not any(next_rect.colliderect(r) for r in collision_rects):
+        if not collision_rects.collides(next_rect):
             self.rect.y += dy
 
         self.rect.clamp_ip(map_rect)
@@ -137,9 +131,9 @@ class Player(pygame.sprite.Sprite):
                 if self.frame_timer >= self.frame_duration:
                     self.frame_index = (self.frame_index + 1) % self.FRAMES_PER_DIR
                     self.frame_timer = 0
-                self.image = self.animations[self.direction][self.frame_index]
+                self.set_frame(True, self.direction, self.frame_index)
             else:
-                self.image = self.idles[self.direction]
+                self.set_frame(False, self.direction)
                 self.frame_index = 0
                 self.frame_timer = 0
 
@@ -153,6 +147,7 @@ class Player(pygame.sprite.Sprite):
         if self.time_since_dash < self.dash_cooldown or self.energy < 10:
             return
 
+        collision_rects = SpatialGrid.ensure(collision_rects)
         dash_distance = self.speed * dt * 100
         dir_map = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
         dx, dy = dir_map.get(self.direction, (0, 0))
@@ -160,11 +155,11 @@ class Player(pygame.sprite.Sprite):
         dy *= dash_distance
 
         next_rect = self.rect.move(dx, 0)
-        if not any(next_rect.colliderect(r) for r in collision_rects):
+        if not collision_rects.collides(next_rect):
             self.rect.x += int(dx)
 
         next_rect = self.rect.move(0, dy)
-        if not any(next_rect.colliderect(r) for r in collision_rects):
+        if not collision_rects.collides(next_rect):
             self.rect.y += int(dy)
 
         self.rect.clamp_ip(map_rect)
@@ -189,7 +184,7 @@ class Player(pygame.sprite.Sprite):
         dx, dy = dx / length, dy / length
 
         self.time_since_last_shot = 0
-        return Projectile(
+        return Projectile.pool.acquire(
             start_pos=self.get_projectile_spawn_pos(),
             direction=(dx, dy),
             projectile_type="KiBlast",
@@ -201,10 +196,7 @@ class Player(pygame.sprite.Sprite):
         screen_pos = self.rect if camera is None else camera.apply(self.rect)
         zoom = camera.zoom if camera else 1.0
         
-        zoomed_sprite = pygame.transform.scale(sprite, (
-            int(sprite.get_width() * zoom),
-            int(sprite.get_height() * zoom)
-        ))
+        zoomed_sprite = FrameCache.get(self.frame_key, sprite, zoom)
 
         draw_x = int(screen_pos.centerx - zoomed_sprite.get_width() // 2)
         draw_y = int(screen_pos.bottom - zoomed_sprite.get_height())
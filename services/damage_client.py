@@ -0,0 +1,66 @@
+# services/damage_client.py
+import threading, collections
+from services.damage_service import DamageService
+from services.service_client import SERVICES
+
+class AsyncDamageClient:
+    """
+    Resolves hits against the remote damage service without blocking the frame.
+
+    submit() collects the current tick's hits; flush() hands them to a
+    background worker as one batch, which is sent as a single POST /damage/batch
+    through the shared ServiceClient (pooled keep-alive connections). The game
+    applies the results on its own thread with drain(), typically on the next
+    tick. If the service is
+    unreachable the local DamageService values are used instead.
+    """
+    def __init__(self, base_url: str = None, timeout: float = None, client=None):
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.timeout = timeout
+        self.client = client or SERVICES
+        self._tick = []
+        self._batches = collections.deque()
+        self._done = collections.deque()
+        self._wake = threading.Event()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def submit(self, target, projectile_type: str, distance: float):
+        self._tick.append((target, projectile_type, float(distance)))
+
+    def flush(self):
+        """Send everything submitted this tick as one batch."""
+        if self._tick:
+            self._batches.append(self._tick)
+            self._tick = []
+            self._wake.set()
+
+    def drain(self) -> int:
+        """Apply finished results on the calling (main) thread; returns how many were applied."""
+        applied = 0
+        while self._done:
+            target, dmg = self._done.popleft()
+            if getattr(target, "alive", lambda: True)():
+                target.take_damage(dmg)
+            applied += 1
+        return applied
+
+    def _resolve(self, batch):
+        try:
+            data = self.client.post("damage.batch", "/damage/batch",
+                                    {"hits": [{"projectile_type": t, "distance": d} for _, t, d in batch]},
+                                    base_url=self.base_url, timeout=self.timeout)
+            damages = [int(d) for d in data["damages"]]
+            if len(damages) == len(batch):
+                return damages
+        except Exception:
+            pass
+        return [int(d) for d in DamageService.get_damages([t for _, t, _ in batch], [d for _, _, d in batch])]
+
+    def _worker(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self._batches:
+                batch = self._batches.popleft()
+                for (target, _, _), dmg in zip(batch, self._resolve(batch)):
+                    self._done.append((target, dmg))
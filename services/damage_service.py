@@ -1,8 +1,29 @@
 # services/damage_service.py
 import json, os, math
 
+try:
+    import numpy as np
+except ImportError:  # get_damages() falls back to a list comprehension
+    np = None
+
 class DamageService:
+    """
+    Damage per projectile type and travelled distance, from config/damage_config.json.
+
+    The config is compiled once into a table per type holding the damage at
+    every QUANTUM px of distance, out to where the falloff bottoms out at 1
+    (capped at MAX_SLOTS); a lookup is then a single index. Distances are
+    rounded up to the next slot: falloff steps land on slot edges for the
+    shipped rules (200 px / falloff_per_200 is a whole number of pixels), so
+    tables agree with the formula exactly. Anything past the end of a table
+    that does not saturate uses the formula. Negative and NaN distances read
+    slot 0 and +inf the last slot, the same in get_damage and get_damages.
+    """
+    QUANTUM = 1.0
+    MAX_SLOTS = 8192
     _cache = None
+    _tables = None   # type -> (damages per slot, saturates)
+    _arrays = None   # NumPy form of the tables for get_damages()
 
     @classmethod
     def _load(cls):
@@ -13,12 +34,110 @@ class DamageService:
         return cls._cache
 
     @classmethod
-    def get_damage(cls, projectile_type: str, distance: float = 0.0) -> int:
+    def _rule(cls, projectile_type):
         cfg = cls._load()
-        rule = cfg.get(projectile_type, cfg.get("_default", {"base": 10}))
+        return cfg.get(projectile_type, cfg.get("_default", {"base": 10}))
+
+    @staticmethod
+    def _formula(rule, distance):
         base = rule.get("base", 10)
         # optional distance falloff
         fall = rule.get("falloff_per_200", 0)  # damage subtract per 200px
         if fall:
             base = max(1, int(base - (distance / 200.0) * fall))
         return base
+
+    @classmethod
+    def _compile(cls):
+        # type -> (damage per slot, whether the last slot holds for every longer distance)
+        tables = {}
+        rules = dict(cls._load())
+        rules.setdefault("_default", {"base": 10})
+        for name, rule in rules.items():
+            base, fall = rule.get("base", 10), rule.get("falloff_per_200", 0)
+            slots = 1 if fall == 0 else cls.MAX_SLOTS
+            if fall > 0:
+                slots = min(slots, math.ceil((base - 1) * 200.0 / fall / cls.QUANTUM) + 2)
+            table = [cls._formula(rule, i * cls.QUANTUM) for i in range(slots)]
+            tables[name] = (table, fall == 0 or (fall > 0 and table[-1] == 1))
+        cls._tables = tables
+        return tables
+
+    @classmethod
+    def reload(cls):
+        """Re-read the config and rebuild the tables."""
+        cls._cache = cls._tables = cls._arrays = None
+        cls._compile()
+
+    @classmethod
+    def get_damage(cls, projectile_type: str, distance: float = 0.0) -> int:
+        tables = cls._tables or cls._compile()
+        table, saturates = tables.get(projectile_type) or tables["_default"]
+        if not math.isfinite(distance):
+            return table[-1] if distance > 0 else table[0]
+        slot = math.ceil(distance / cls.QUANTUM)
+        if slot < len(table):
+            return table[max(slot, 0)]
+        if saturates:
+            return table[-1]
+        return cls._formula(cls._rule(projectile_type), distance)
+
+    # ───────────── batched lookups ─────────────
+    @classmethod
+    def _build_arrays(cls):
+        tables = cls._tables or cls._compile()
+        rules = cls._load()
+        names = list(tables)
+        matrix = np.zeros((len(names), max(len(t) for t, _ in tables.values())), dtype=np.int64)
+        lengths = np.zeros(len(names), dtype=np.int64)
+        saturates = np.zeros(len(names), dtype=bool)
+        bases, falls = np.zeros(len(names)), np.zeros(len(names))
+        for row, name in enumerate(names):
+            table, saturates[row] = tables[name]
+            matrix[row, :len(table)] = table
+            lengths[row] = len(table)
+            rule = rules.get(name, {"base": 10})
+            bases[row], falls[row] = rule.get("base", 10), rule.get("falloff_per_200", 0)
+        rows = {name: row for row, name in enumerate(names)}
+        cls._arrays = (rows, matrix, lengths, saturates, bases, falls)
+        return cls._arrays
+
+    @classmethod
+    def type_index(cls, projectile_type):
+        """Row of `projectile_type` in the batched tables, for get_damages(); unknown types map to _default."""
+        rows = (cls._arrays or cls._build_arrays())[0]
+        return rows.get(projectile_type, rows["_default"])
+
+    @classmethod
+    def get_damages(cls, projectile_types, distances):
+        """
+        get_damage over many hits at once. `projectile_types` is one type for
+        every hit, or parallel to `distances`: a sequence of names or a NumPy
+        int array of type_index() rows (fastest). Returns a NumPy int array
+        (a list without NumPy).
+        """
+        if np is None:
+            if isinstance(projectile_types, str):
+                projectile_types = [projectile_types] * len(distances)
+            return [cls.get_damage(t, d) for t, d in zip(projectile_types, distances)]
+        rows, matrix, lengths, saturates, bases, falls = cls._arrays or cls._build_arrays()
+        d = np.asarray(distances, dtype=np.float64)
+        if isinstance(projectile_types, str):
+            row = np.full(len(d), cls.type_index(projectile_types), dtype=np.int64)
+        elif isinstance(projectile_types, np.ndarray) and projectile_types.dtype.kind in "iu":
+            row = projectile_types.astype(np.int64, copy=False)
+        else:
+            default = rows["_default"]
+            row = np.fromiter((rows.get(t, default) for t in projectile_types), dtype=np.int64, count=len(d))
+        n = lengths[row]
+        # clip before the int cast (NaN/inf/huge values do not convert); +inf reads the last slot
+        finite = np.isfinite(d)
+        slot = np.ceil(np.clip(np.where(finite, d, 0.0), 0.0, cls.MAX_SLOTS * cls.QUANTUM) / cls.QUANTUM)
+        slot = np.where(d == np.inf, n - 1, slot.astype(np.int64))
+        out = matrix[row, np.minimum(slot, n - 1)]
+        # off the end of a table that does not saturate: the formula
+        formula = (slot >= n) & ~saturates[row]
+        if formula.any():
+            b, f, df = bases[row[formula]], falls[row[formula]], d[formula]
+            out[formula] = np.where(f != 0, np.maximum(1, np.trunc(b - (df / 200.0) * f)), b).astype(np.int64)
+        return out
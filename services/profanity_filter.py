@@ -0,0 +1,97 @@
+# services/profanity_filter.py
+
+def _is_word(c):
+    # the characters regex \w matches (Unicode letters, digits, underscore)
+    return c.isalnum() or c == "_"
+
+class ProfanityMatcher:
+    """
+    Whole-word, case-insensitive matcher over a word list (Aho-Corasick).
+
+    The list is compiled once into a trie with failure links, so finding
+    every listed word in a message is one pass over its characters however
+    long the list is. A hit counts when it starts and ends on a word boundary
+    (as regex \\b); of hits starting at the same place the longest wins, and
+    hits are taken left to right without overlapping, like re.sub.
+    """
+    def __init__(self, words):
+        self.words = sorted({w.lower() for w in words if w})
+        self._goto = [{}]     # state -> {char: state}
+        self._fail = [0]
+        self._out = [()]      # state -> lengths of the words ending here (own + via failure links)
+        for word in self.words:
+            state = 0
+            for c in word:
+                nxt = self._goto[state].get(c)
+                if nxt is None:
+                    nxt = self._goto[state][c] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] = (len(word),)
+        # breadth-first: a state's failure target is always settled before the state itself
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for c, nxt in self._goto[state].items():
+                f = self._fail[state]
+                while f and c not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(c, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def __len__(self):
+        return len(self.words)
+
+    @staticmethod
+    def _fold(text):
+        low = text.lower()
+        if len(low) == len(text):
+            return low
+        # a few characters lower-case to two (e.g. "İ"): keep positions aligned with `text`
+        return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def find(self, text):
+        """(start, end) spans of the listed words in `text`."""
+        if not self.words or not text:
+            return []
+        low = self._fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        n = len(text)
+        best = {}   # start -> longest end
+        state = 0
+        for i, c in enumerate(low):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if not out[state]:
+                continue
+            end = i + 1
+            if _is_word(text[i]) == (end < n and _is_word(text[end])):
+                continue  # no word boundary after the hit
+            for length in out[state]:
+                start = end - length
+                if _is_word(text[start]) == (start > 0 and _is_word(text[start - 1])):
+                    continue  # no word boundary before it
+                if best.get(start, -1) < end:
+                    best[start] = end
+        spans, last = [], 0
+        for start in sorted(best):
+            if start >= last:
+                spans.append((start, best[start]))
+                last = best[start]
+        return spans
+
+    def censor(self, text):
+        """(found, text with every hit replaced by same-length asterisks)."""
+        spans = self.find(text)
+        if not spans:
+            return False, text
+        parts, last = [], 0
+        for start, end in spans:
+            parts.append(text[last:start])
+            parts.append("*" * (end - start))
+            last = end
+        parts.append(text[last:])
+        return True, "".join(parts)
@@ -0,0 +1,151 @@
+# services/service_client.py
+import os, json, time, threading, http.client, urllib.parse
+from core.profiler import PROFILER
+
+# base URLs of the backing services; each can be overridden with <NAME>_SERVICE_URL
+DEFAULT_URLS = {
+    "race":   "http://localhost:7001",
+    "damage": "http://localhost:7002",
+    "spawn":  "http://localhost:7003",
+    "chat":   "http://localhost:7004",
+}
+
+# seconds per endpoint; endpoints not listed get DEFAULT_TIMEOUT
+TIMEOUTS = {
+    "race.metadata":  0.5,
+    "spawn.generate": 0.5,
+    "chat.filter":    0.5,
+    "damage.batch":   1.5,
+}
+DEFAULT_TIMEOUT = 1.0
+
+class ServiceError(Exception):
+    """A service call failed: unreachable, timed out, HTTP error status or a non-JSON reply."""
+
+class ServiceClient:
+    """
+    JSON-over-HTTP client shared by every game-side service call.
+
+    Connections are kept alive and pooled per host, so a call reuses an idle
+    socket instead of opening a new one; the client is safe to use from worker
+    threads. Calls name their endpoint as "<service>.<route>" (e.g.
+    "chat.filter"): the service part picks the base URL, the whole name picks
+    the timeout and the profiler span (service.chat.filter) that receives the
+    call's latency. stats() has request/error counts and latency per endpoint.
+    """
+    def __init__(self, urls=None, timeouts=None, max_idle=4):
+        self.urls = {name: os.getenv(f"{name.upper()}_SERVICE_URL", url) for name, url in DEFAULT_URLS.items()}
+        self.urls.update(urls or {})
+        self.timeouts = {**TIMEOUTS, **(timeouts or {})}
+        self.max_idle = max_idle   # idle connections kept per host
+        self.requests = 0
+        self.errors = 0
+        self._idle = {}            # (host, port) -> [HTTPConnection]
+        self._stats = {}           # endpoint -> [requests, errors, seconds, last seconds]
+        self._lock = threading.Lock()
+
+    # ───────────── connection pool ─────────────
+    def _checkout(self, host, port, timeout):
+        with self._lock:
+            idle = self._idle.get((host, port))
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return http.client.HTTPConnection(host, port, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, host, port, conn):
+        with self._lock:
+            idle = self._idle.setdefault((host, port), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    # ───────────── requests ─────────────
+    def _send(self, method, base_url, path, body, timeout):
+        parsed = urllib.parse.urlsplit(base_url)
+        host, port = parsed.hostname or "localhost", parsed.port or 80
+        target = parsed.path.rstrip("/") + path
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        while True:
+            conn, reused = self._checkout(host, port, timeout)
+            try:
+                conn.request(method, target, body, headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # the server dropped a kept-alive socket: retry on a fresh one
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(host, port, conn)
+            return resp.status, raw
+
+    def request(self, endpoint, method, path, payload=None, base_url=None, timeout=None):
+        """
+        Call `path` on the endpoint's service and return the decoded JSON reply.
+        base_url/timeout override the configured ones for this call. Raises
+        ServiceError on any failure.
+        """
+        service = endpoint.split(".", 1)[0]
+        base_url = base_url or self.urls[service]
+        timeout = timeout if timeout is not None else self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        start = time.perf_counter()
+        try:
+            status, raw = self._send(method, base_url, path, body, timeout)
+            if status >= 400:
+                raise ServiceError(f"{endpoint}: HTTP {status}")
+            data = json.loads(raw.decode("utf-8")) if raw else None
+        except ServiceError:
+            self._record(endpoint, start, failed=True)
+            raise
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self._record(endpoint, start, failed=True)
+            raise ServiceError(f"{endpoint}: {e}") from e
+        self._record(endpoint, start, failed=False)
+        return data
+
+    def get(self, endpoint, path, **kwargs):
+        return self.request(endpoint, "GET", path, **kwargs)
+
+    def post(self, endpoint, path, payload, **kwargs):
+        return self.request(endpoint, "POST", path, payload, **kwargs)
+
+    # ───────────── counters ─────────────
+    def _record(self, endpoint, start, failed):
+        elapsed = time.perf_counter() - start
+        PROFILER.add(f"service.{endpoint}", elapsed, start)
+        with self._lock:
+            entry = self._stats.setdefault(endpoint, [0, 0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += failed
+            entry[2] += elapsed
+            entry[3] = elapsed
+            self.requests += 1
+            self.errors += failed
+
+    def stats(self):
+        """endpoint -> requests, errors, average and last latency (ms)."""
+        with self._lock:
+            return {name: {"requests": n, "errors": err, "avg_ms": 1000.0 * total / n, "last_ms": 1000.0 * last}
+                    for name, (n, err, total, last) in self._stats.items()}
+
+# process-wide instance used by the screens and service clients
+SERVICES = ServiceClient()
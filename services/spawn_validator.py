@@ -1,11 +1,12 @@
 
 import random, math, pygame
+from core.spatial_grid import SpatialGrid
 
 class SpawnValidator:
     @staticmethod
     def is_valid_spawn(x, y, collider_rects, avoid_point=None, min_distance=0):
         test_rect = pygame.Rect(x - 16, y - 32, 32, 64)
-        if any(test_rect.colliderect(r) for r in collider_rects):
+        if SpatialGrid.ensure(collider_rects).collides(test_rect):
             return False
         if avoid_point:
             ax, ay = avoid_point
@@ -17,6 +18,7 @@ class SpawnValidator:
     def generate_spawns(cls, want, map_width, map_height, collider_rects, avoid_point=None, min_distance=0, max_attempts=300):
         result = []
         attempts = 0
+        collider_rects = SpatialGrid.ensure(collider_rects)  # index once for all attempts
         while len(result) < want and attempts < max_attempts:
             attempts += 1
             x = random.randint(32, map_width  - 32)
@@ -1,8 +1,9 @@
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import re
-import os
+import os, sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services.profanity_filter import ProfanityMatcher
 
 app = Flask(__name__)
 CORS(app)
@@ -22,9 +23,10 @@ def load_bad_words():
 
 BAD_WORDS = load_bad_words()
 
-# precompile a regex that matches whole words from the list (case-insensitive)
-# words like "ass" are excluded by default to reduce false positives; add deliberately via env if needed
-bad_word_pattern = re.compile(r"\b(" + "|".join(map(re.escape, BAD_WORDS)) + r")\b", re.IGNORECASE)
+# compile a matcher for whole words from the list (case-insensitive); one pass per message
+# whatever the list size. Words like "ass" are excluded by default to reduce false positives;
+# add deliberately via env if needed
+bad_word_matcher = ProfanityMatcher(BAD_WORDS)
 
 @app.get("/health")
 def health():
@@ -37,36 +39,44 @@ def filter_text(message: str):
     """
     if not isinstance(message, str):
         return True, "", "invalid_message_type"
-    found = bad_word_pattern.search(message or "")
+    # each match is replaced with same-length asterisks
+    found, censored = bad_word_matcher.censor(message)
     if not found:
         return True, message, None
-
-    # replace each match with same-length asterisks
-    def repl(m):
-        return "*" * (m.end() - m.start())
-
-    censored = bad_word_pattern.sub(repl, message)
     return False, censored, "profanity"
 
-@app.post("/filter")
-def filter_endpoint():
-    try:
-        data = request.get_json(force=True) or {}
-    except Exception:
-        return jsonify({"allowed": True, "filtered_text": "", "reason": "invalid_json"}), 200
-
+def _filter_payload(data):
     username = data.get("username") or data.get("user_name") or "Player"
     message = data.get("message") or data.get("text") or ""
     allowed, filtered_text, reason = filter_text(message)
 
     # Always loggable structure; the client should trust "allowed" and display accordingly
-    payload = {
+    return {
         "allowed": bool(allowed),
         "filtered_text": str(filtered_text),
         "reason": reason,
         "username": username,
     }
-    return jsonify(payload), 200
+
+@app.post("/filter")
+def filter_endpoint():
+    try:
+        data = request.get_json(force=True) or {}
+    except Exception:
+        return jsonify({"allowed": True, "filtered_text": "", "reason": "invalid_json"}), 200
+
+    return jsonify(_filter_payload(data if isinstance(data, dict) else {})), 200
+
+@app.post("/filter/batch")
+def filter_batch_endpoint():
+    # body: {"messages": [{"username": "...", "message": "..."}, ...]} -> {"results": [<as /filter>, ...]}
+    data = request.get_json(force=True, silent=True) or {}
+    messages = data.get("messages", []) if isinstance(data, dict) else data
+    if not isinstance(messages, list):
+        # like /filter with a bad body: nothing to filter, not an error
+        return jsonify({"results": [], "reason": "invalid_messages"}), 200
+    results = [_filter_payload(m if isinstance(m, dict) else {"message": m}) for m in messages]
+    return jsonify({"results": results}), 200
 
 if __name__ == "__main__":
     # Default port 7004 to match client expectation
@@ -2,7 +2,7 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from services.damage_service import DamageService
-import sys, os
+import sys, os, math
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
@@ -23,5 +23,39 @@ def get_damage():
     dmg = DamageService.get_damage(projectile_type, distance)
     return jsonify({"projectile_type": projectile_type, "distance": distance, "damage": int(dmg)})
 
+def _bad_request(message):
+    return jsonify({"error": message}), 400
+
+@app.post("/damage/batch")
+def get_damage_batch():
+    # body: {"hits": [{"projectile_type": "...", "distance": 0.0}, ...]} -> {"damages": [int, ...]}
+    # malformed bodies get 400 {"error": ...}; a missing projectile_type/distance defaults as in /damage
+    data = request.get_json(force=True, silent=True)
+    if data is None:
+        return _bad_request("body must be JSON")
+    hits = data.get("hits", []) if isinstance(data, dict) else data
+    if not isinstance(hits, list):
+        return _bad_request("hits must be a list")
+    types, distances = [], []
+    for i, hit in enumerate(hits):
+        if not isinstance(hit, dict):
+            return _bad_request(f"hits[{i}] must be an object")
+        projectile_type = hit.get("projectile_type", "_default")
+        if not isinstance(projectile_type, str):
+            return _bad_request(f"hits[{i}].projectile_type must be a string")
+        distance = hit.get("distance", 0)
+        if isinstance(distance, bool) or not isinstance(distance, (int, float, str)):
+            return _bad_request(f"hits[{i}].distance must be a number")
+        try:
+            distance = float(distance)
+        except ValueError:
+            return _bad_request(f"hits[{i}].distance must be a number")
+        if not math.isfinite(distance):
+            return _bad_request(f"hits[{i}].distance must be finite")
+        types.append(projectile_type)
+        distances.append(distance)
+    damages = DamageService.get_damages(types, distances)
+    return jsonify({"damages": [int(d) for d in damages]})
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=7002, debug=True)
@@ -1,12 +1,85 @@
+from core.flow_field import FlowField
+from core.profiler import PROFILER
+from entities.enemies import Enemy, LOSE_RADIUS
+
 class EnemyController:
-    def __init__(self, enemies, collision_rects, map_rect):
+    # activity tiers by distance to the player: (max distance, tick every N frames).
+    # Slower tiers get the accumulated dt; beyond the last tier enemies sleep (frozen).
+    # Anything the camera can see (plus VIEW_MARGIN) and anything recently hurt runs at full rate.
+    LOD_TIERS = ((400, 1), (1100, 3), (2400, 6))
+    RETIER_EVERY = 15   # frames between re-tiering passes
+    VIEW_MARGIN = 128   # px around the view: covers what scrolls in before the next retier
+    WAKE_SECONDS = 5.0  # a hurt enemy stays at full rate until left alone this long
+    FLOW_RADIUS = LOSE_RADIUS + 160  # chasers stay within LOSE_RADIUS; the margin lets paths swing round walls
+
+    def __init__(self, enemies, collision_rects, map_rect, lod=True):
         self.enemies = enemies
         self.collision_rects = collision_rects
         self.map_rect = map_rect
-    def update(self, dt, player):
-        for e in self.enemies:
-            e.update(dt, player, self.collision_rects, self.map_rect)
+        # one path field toward the player, shared by every chasing enemy (needs the tile bitmap)
+        self.flow_field = (FlowField(collision_rects, (Enemy.FRAME_WIDTH, Enemy.FRAME_HEIGHT), self.FLOW_RADIUS)
+                           if hasattr(collision_rects, "cells") else None)
+        self.lod = lod
+        self.tiers = None  # one list of enemies per LOD tier, plus the sleepers last
+        self._tick = 0
+        self._clock = 0.0  # simulated seconds, for wake timers
+        self._phase = 0
+        self._tiered_count = 0
+
+    def _retier(self, player, camera=None):
+        px, py = player.rect.center
+        view = camera.view_rect(self.VIEW_MARGIN) if camera is not None else None
+        limits = [d * d for d, _ in self.LOD_TIERS]
+        tiers = [[] for _ in range(len(limits) + 1)]
         for e in self.enemies:
+            if not hasattr(e, "_lod_phase"):
+                # stagger reduced-rate updates so a tier doesn't all tick on the same frame
+                e._lod_phase, e._lod_dt, e._lod_wake = self._phase, 0.0, -1.0
+                self._phase += 1
+            # taking damage wakes an enemy regardless of distance, until it is left alone for a while
+            if e.health < getattr(e, "_lod_health", e.health):
+                e._lod_wake = self._clock + self.WAKE_SECONDS
+            e._lod_health = e.health
+            dx, dy = e.rect.centerx - px, e.rect.centery - py
+            if e._lod_wake > self._clock or (view is not None and view.colliderect(e.rect)):
+                d2 = 0
+            else:
+                d2 = dx * dx + dy * dy
+            tier = len(limits)
+            for i, limit in enumerate(limits):
+                if d2 <= limit:
+                    tier = i
+                    break
+            tiers[tier].append(e)
+        self.tiers = tiers
+        self._tiered_count = len(self.enemies)
+        for i, members in enumerate(tiers[:-1]):
+            PROFILER.count(f"enemies.tier{i}", len(members))
+        PROFILER.count("enemies.asleep", len(tiers[-1]))
+
+    def update(self, dt, player, camera=None):
+        if self.flow_field is not None:
+            self.flow_field.set_target(*player.rect.center)
+        if not self.lod:
+            nearby = list(self.enemies)
+            for e in nearby:
+                e.update(dt, player, self.collision_rects, self.map_rect, self.flow_field)
+        else:
+            self._tick += 1
+            self._clock += dt
+            if self.tiers is None or self._tick % self.RETIER_EVERY == 0 or len(self.enemies) != self._tiered_count:
+                self._retier(player, camera)
+            for (_, every), members in zip(self.LOD_TIERS, self.tiers):
+                for e in members:
+                    if not e.alive():
+                        continue
+                    e._lod_dt += dt
+                    if (self._tick + e._lod_phase) % every == 0:
+                        e.update(e._lod_dt, player, self.collision_rects, self.map_rect, self.flow_field)
+                        e._lod_dt = 0.0
+            # only the full-rate tier can be touching the player
+            nearby = [e for e in self.tiers[0] if e.alive()]
+        for e in nearby:
             if player.rect.colliderect(e.rect):
                 cd = getattr(e, '_hit_cooldown', 0.0)
                 if cd <= 0.0:
@@ -16,4 +89,4 @@ class EnemyController:
                     e._hit_cooldown = cd - dt
     def draw(self, surface, camera):
         for e in self.enemies:
-            e.draw(surface, camera)
\ No newline at end of file
+            e.draw(surface, camera)
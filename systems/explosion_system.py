@@ -1,7 +1,11 @@
 import pygame
+from core.explosion import Explosion
+from core.object_pool import PooledGroup
 class ExplosionSystem:
     def __init__(self):
-        self.explosions = pygame.sprite.Group()
+        # finished explosions leave the group and go back to the pool
+        self.pool = Explosion.pool
+        self.explosions = PooledGroup()
     def update(self, dt):
         self.explosions.update(dt)
     def draw(self, surface, camera):
@@ -0,0 +1,223 @@
+import random
+import numpy as np
+from core.flow_field import FlowField
+from core.profiler import PROFILER
+from entities.enemies import (Enemy, ATTACK_RADIUS, CHASE_RADIUS, LOSE_RADIUS,
+                              SHOT_COOLDOWN, PATROL_SPEED)
+
+# field rows of the state array (one column per enemy)
+X, Y, W, H, SPEED, STATE, DIR, TURN_TIMER, SHOOT_TIMER, FRAME_TIMER, FRAME, MOVING, HIT_COOLDOWN, SYNCED, ARMED = range(15)
+N_COLS = 15
+PATROL, CHASE, ATTACK = 0, 1, 2
+STATE_NAMES = ("patrol", "chase", "attack")
+# unit vectors in Enemy.DIRECTIONS order: right, up, left, down
+DIR_X = np.array([1.0, 0.0, -1.0, 0.0])
+DIR_Y = np.array([0.0, -1.0, 0.0, 1.0])
+
+
+class HordeEnemyController:
+    """
+    Structure-of-arrays EnemyController for large hordes.
+
+    Positions, FSM state, facing, patrol/shoot timers, animation frame and
+    contact cooldown live in one field-major NumPy array; distance checks, state
+    transitions, chase vectors (via the shared flow field), wall collisions
+    and contact damage run as vectorized passes over every enemy. The Enemy
+    sprites stay the owners of health (projectiles damage and kill them);
+    their rects are only synced near the player and their frames only for
+    enemies on screen. Enemies beyond SLEEP_RADIUS are frozen.
+    """
+    SLEEP_RADIUS = 2400
+    SYNC_RADIUS = 1100     # rects kept current for projectiles, contact and drawing
+    RECONCILE_EVERY = 30   # frames between full membership checks against the group
+    FLOW_RADIUS = LOSE_RADIUS + 160  # path search window around the player, as EnemyController
+
+    def __init__(self, enemies, collision_rects, map_rect, capacity=256):
+        self.enemies = enemies
+        self.collision_rects = collision_rects
+        self.map_rect = map_rect
+        self.flow_field = (FlowField(collision_rects, (Enemy.FRAME_WIDTH, Enemy.FRAME_HEIGHT), self.FLOW_RADIUS)
+                           if hasattr(collision_rects, "cells") else None)
+        self.state = np.zeros((N_COLS, capacity), dtype=np.float64)  # one row per field: contiguous columns
+        self.objects = []
+        self.rects = []
+        # patrol turns draw from their own generator, seeded from `random` so seeded runs repeat
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self._tick = 0
+        self._reconcile()
+
+    def __len__(self):
+        return len(self.objects)
+
+    @staticmethod
+    def _row(e):
+        return (e.x, e.y, e.rect.width, e.rect.height, e.speed, STATE_NAMES.index(e.state),
+                Enemy.DIRECTIONS.index(e.direction), e.change_dir_timer, e.shoot_timer,
+                e.frame_timer, e.frame_index, 0.0, getattr(e, "_hit_cooldown", 0.0), 1.0,
+                float(e.projectile_group is not None))  # ARMED: as of joining (set projectile_group before adding)
+
+    def _reconcile(self):
+        # drop killed enemies, pick up ones added to the group since the last pass
+        known = {id(e): i for i, e in enumerate(self.objects)}
+        members = self.enemies.sprites()
+        src = np.array([known.get(id(e), -1) for e in members], dtype=np.intp)
+        old = self.state[:, :len(self.objects)].copy()
+        capacity = self.state.shape[1]
+        if len(members) > capacity:
+            self.state = np.zeros((N_COLS, max(len(members), 2 * capacity)), dtype=np.float64)
+        tracked = np.flatnonzero(src >= 0)
+        self.state[:, tracked] = old[:, src[tracked]]
+        for n in np.flatnonzero(src < 0):
+            self.state[:, n] = self._row(members[n])
+        self.objects = members
+        self.rects = [e.rect for e in members]
+        self._deaths = Enemy.deaths
+
+    def _blocked(self, left, top, w, h):
+        walls = self.collision_rects
+        if not walls or len(left) == 0:
+            return np.zeros(len(left), dtype=bool)
+        if hasattr(walls, "rects_solid"):
+            return np.asarray(walls.rects_solid(left, top, w, h), dtype=bool)
+        return np.array([walls.collides((int(l), int(t), int(ww), int(hh)))
+                         for l, t, ww, hh in zip(left, top, w, h)], dtype=bool)
+
+    def update(self, dt, player, camera=None):
+        # camera is accepted for EnemyController's signature; every awake enemy already ticks each frame
+        self._tick += 1
+        # a kill (even one matched by a spawn in the same tick) drops the dead row straight away
+        # (spritedict: len(group) copies the member list)
+        if (Enemy.deaths != self._deaths or len(self.enemies.spritedict) != len(self.objects)
+                or self._tick % self.RECONCILE_EVERY == 0):
+            self._reconcile()
+        n = len(self.objects)
+        if n == 0:
+            return
+        s = self.state[:, :n]
+        px, py = player.rect.center
+
+        # FSM on distance to the player
+        dist = np.hypot(px - s[X], py - s[Y])
+        awake = dist <= self.SLEEP_RADIUS
+        st = s[STATE]
+        st[:] = np.where(dist <= ATTACK_RADIUS, ATTACK,
+                         np.where(dist <= CHASE_RADIUS, CHASE,
+                                  np.where(dist > LOSE_RADIUS, PATROL, st)))
+        s[SHOOT_TIMER, awake] += dt
+
+        # patrol: walk the facing direction, re-rolled every 1.5-3 s
+        patrol = awake & (st == PATROL)
+        s[TURN_TIMER, patrol] -= dt
+        turn = np.flatnonzero(patrol & (s[TURN_TIMER] <= 0))
+        if len(turn):
+            s[TURN_TIMER, turn] = self.rng.uniform(1.5, 3.0, len(turn))
+            s[DIR, turn] = self.rng.integers(0, 4, len(turn))
+        d = s[DIR].astype(np.intp)
+        vx = np.where(patrol, DIR_X[d] * PATROL_SPEED * dt, 0.0)
+        vy = np.where(patrol, DIR_Y[d] * PATROL_SPEED * dt, 0.0)
+
+        # chase/attack: head for the next flow-field tile, or straight at the player
+        chasing = np.flatnonzero(awake & (st != PATROL))
+        if len(chasing):
+            cx, cy = s[X, chasing], s[Y, chasing]
+            tx, ty = np.full(len(chasing), float(px)), np.full(len(chasing), float(py))
+            if self.flow_field is not None:
+                self.flow_field.set_target(px, py)
+                fx, fy, ok = self.flow_field.steps_toward_many(cx, cy)
+                tx, ty = np.where(ok, fx, tx), np.where(ok, fy, ty)
+            cdx, cdy = tx - cx, ty - cy
+            length = np.maximum(np.hypot(cdx, cdy), 1e-6)
+            vx[chasing] = cdx / length * s[SPEED, chasing] * dt
+            vy[chasing] = cdy / length * s[SPEED, chasing] * dt
+            s[DIR, chasing] = np.where(np.abs(cdx) > np.abs(cdy), np.where(cdx > 0, 0, 2), np.where(cdy > 0, 3, 1))
+
+        # move one axis at a time, undoing the step on a wall (as Enemy._move);
+        # sub-pixel steps leave the rect where it was, so only pixel changes are checked
+        w, h = s[W].astype(np.int64), s[H].astype(np.int64)
+        old_cx, old_cy = s[X].astype(np.int64), s[Y].astype(np.int64)
+        nx = s[X] + vx
+        new_cx = nx.astype(np.int64)
+        idx = np.flatnonzero(new_cx != old_cx)
+        if len(idx):
+            hit = idx[self._blocked(new_cx[idx] - w[idx] // 2, old_cy[idx] - h[idx] // 2, w[idx], h[idx])]
+            nx[hit], new_cx[hit] = s[X, hit], old_cx[hit]
+        s[X] = nx
+        ny = s[Y] + vy
+        new_cy = ny.astype(np.int64)
+        idx = np.flatnonzero(new_cy != old_cy)
+        if len(idx):
+            hit = idx[self._blocked(new_cx[idx] - w[idx] // 2, new_cy[idx] - h[idx] // 2, w[idx], h[idx])]
+            ny[hit], new_cy[hit] = s[Y, hit], old_cy[hit]
+        s[Y] = ny
+        if self.map_rect:
+            m = self.map_rect
+            lo_x, hi_x = m.left + w // 2, m.right - w + w // 2
+            lo_y, hi_y = m.top + h // 2, m.bottom - h + h // 2
+            out = (new_cx < lo_x) | (new_cx > hi_x) | (new_cy < lo_y) | (new_cy > hi_y)
+            if out.any():
+                new_cx = np.where(out, np.clip(new_cx, lo_x, hi_x), new_cx)
+                new_cy = np.where(out, np.clip(new_cy, lo_y, hi_y), new_cy)
+                s[X, out], s[Y, out] = new_cx[out], new_cy[out]
+        moved = (new_cx != old_cx) | (new_cy != old_cy)
+
+        # animation: advance while moving, idle frame otherwise; sleepers stay frozen
+        s[MOVING] = moved
+        s[FRAME_TIMER, moved] += dt
+        step = moved & (s[FRAME_TIMER] >= 0.15)
+        s[FRAME_TIMER, step] = 0.0
+        s[FRAME, step] = (s[FRAME, step] + 1) % Enemy.FRAMES_PER_DIR
+        s[FRAME, awake & ~moved] = 0
+
+        # keep sprite rects current where projectiles, contact and the camera can see them
+        in_range = dist <= self.SYNC_RADIUS
+        near = np.flatnonzero(in_range & (moved | (s[SYNCED] == 0)))
+        s[SYNCED, near] = 1.0
+        s[SYNCED, moved & ~in_range] = 0.0
+        rects = self.rects
+        for i, x, y in zip(near.tolist(), new_cx[near].tolist(), new_cy[near].tolist()):
+            rects[i].center = (x, y)
+        objects = self.objects
+
+        # shooting: only the few attackers whose cooldown is up touch Python objects
+        for i in np.flatnonzero((st == ATTACK) & awake & (s[SHOOT_TIMER] >= SHOT_COOLDOWN) & (s[ARMED] != 0)):
+            e = objects[i]
+            if e.projectile_group is None or not e.alive():
+                continue
+            e.shoot_timer = s[SHOOT_TIMER, i]
+            e._shoot(player)
+            s[SHOOT_TIMER, i] = e.shoot_timer
+
+        # contact damage, same cooldown rules as EnemyController
+        pr = player.rect
+        left, top = new_cx - w // 2, new_cy - h // 2
+        touch = (left < pr.right) & (left + w > pr.left) & (top < pr.bottom) & (top + h > pr.top)
+        if touch.any():
+            ready = touch & (s[HIT_COOLDOWN] <= 0.0)
+            # rows whose sprite left the group without a kill() wait for the next reconcile: no contact
+            player.health -= 10 * sum(1 for i in np.flatnonzero(ready) if objects[i].alive())
+            s[HIT_COOLDOWN, ready] = 0.5
+            s[HIT_COOLDOWN, touch & ~ready] -= dt
+
+        PROFILER.count("enemies.asleep", n - int(np.count_nonzero(awake)))
+
+    def _sync_visuals(self, i):
+        e, row = self.objects[i], self.state[:, i]
+        e.x, e.y = float(row[X]), float(row[Y])
+        e.state = STATE_NAMES[int(row[STATE])]
+        e.direction = Enemy.DIRECTIONS[int(row[DIR])]
+        e.frame_index = int(row[FRAME])
+        e._set_frame(bool(row[MOVING]))
+        return e
+
+    def draw(self, surface, camera):
+        n = len(self.objects)
+        if n == 0:
+            return
+        s, zoom = self.state[:, :n], camera.zoom
+        sx = (s[X] - camera.offset_x) * zoom
+        sy = (s[Y] - camera.offset_y) * zoom
+        margin = 64 * zoom
+        visible = np.flatnonzero((sx > -margin) & (sx < surface.get_width() + margin) &
+                                 (sy > -margin) & (sy < surface.get_height() + margin))
+        for i in visible:
+            self._sync_visuals(i).draw(surface, camera)
@@ -1,28 +1,65 @@
-import pygame
+import math, pygame
+from core.object_pool import PooledGroup
+from core.projectile import Projectile
+from core.spatial_hash import SpatialHash
 
 class ProjectileSystem:
-    def __init__(self, walls, enemies, explosion_system, players=None):
-        self.projectiles = pygame.sprite.Group()
+    def __init__(self, walls, enemies, explosion_system, players=None, damage_client=None):
+        # killed projectiles leave the group and go back to the pool
+        self.pool        = Projectile.pool
+        self.projectiles = PooledGroup()
         self.walls       = walls
         self.enemies     = enemies
         self.players     = players
         self.explosions  = explosion_system.explosions
+        # optional AsyncDamageClient; None resolves damage in-process
+        self.damage_client = damage_client
+        # broad phase: actors bucketed once per tick, queried by every shot
+        self.enemy_hash  = SpatialHash()
+        self.player_hash = SpatialHash()
 
     def add(self, projectile):
         self.projectiles.add(projectile)
 
+    @staticmethod
+    def _reach(shots, dt):
+        # everything these shots can touch this tick: their rects swept by one step
+        area = shots[0].rect.unionall([p.rect for p in shots[1:]])
+        step = max(p.speed * math.hypot(p.dx, p.dy) for p in shots) * dt
+        return area.inflate(2 * math.ceil(step) + 2, 2 * math.ceil(step) + 2)
+
+    def _broad_phase(self, dt):
+        # rebuild a faction's hash only while the other side has shots in flight
+        player_shots = [p for p in self.projectiles if not p.from_enemy]
+        enemy_shots = len(self.projectiles) > len(player_shots)
+        enemies = players = None
+        if player_shots and self.enemies:
+            self.enemy_hash.rebuild(self.enemies, self._reach(player_shots, dt))
+            enemies = self.enemy_hash
+        if enemy_shots and self.players:
+            self.player_hash.rebuild(self.players)
+            players = self.player_hash
+        return enemies, players
+
     def update(self, dt):
+        if self.damage_client is not None:
+            self.damage_client.drain()
+        enemies, players = self._broad_phase(dt)
         self.projectiles.update(
             dt,
             walls_group       = self.walls,
-            enemies_group     = self.enemies,
-            players_group     = self.players,
-            explosions_group  = self.explosions
+            enemies_group     = enemies,
+            players_group     = players,
+            explosions_group  = self.explosions,
+            damage_client     = self.damage_client
         )
+        if self.damage_client is not None:
+            self.damage_client.flush()  # one batched request per tick
 
-    def draw(self, surface, camera):
+    def draw(self, surface, camera, lag=0.0):
+        # lag: seconds to step back along each projectile's path for render interpolation
         for p in self.projectiles:
             p.draw(surface,
-                   camera.offset_x,
-                   camera.offset_y,
+                   camera.offset_x + p.dx * p.speed * lag,
+                   camera.offset_y + p.dy * p.speed * lag,
                    camera.zoom)
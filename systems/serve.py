@@ -0,0 +1,117 @@
+# systems/serve.py
+"""
+Run a microservice on a production WSGI server instead of Flask's debug server.
+
+    python systems/serve.py chat --workers 16
+    python systems/serve.py damage --server gunicorn --processes 4 --workers 8
+
+Routes and JSON contracts are the app modules' own (systems/*_api.py); only
+the server changes. Servers, in order of preference for --server auto:
+
+  waitress   thread pool of --workers threads, HTTP/1.1 keep-alive (any OS)
+  gunicorn   --processes worker processes with --workers threads each (POSIX)
+  threaded   built-in fallback: Werkzeug's server handing requests to a pool
+             of --workers threads instead of a new thread per request
+             (no keep-alive: Werkzeug closes every connection)
+"""
+import os, sys, argparse, importlib
+from concurrent.futures import ThreadPoolExecutor
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+# service -> (app module, default port); ports match the game's ServiceClient defaults
+APPS = {
+    "race":   ("systems.race_api", 7001),
+    "damage": ("systems.damage_api", 7002),
+    "spawn":  ("systems.spawn_api", 7003),
+    "chat":   ("systems.chat_proxy_api", 7004),
+}
+
+def load_app(service):
+    return importlib.import_module(APPS[service][0]).app
+
+def _serve_waitress(app, host, port, workers, processes):
+    import waitress
+    waitress.serve(app, host=host, port=port, threads=workers, connection_limit=max(100, 4 * workers))
+
+def _serve_gunicorn(app, host, port, workers, processes):
+    from gunicorn.app.base import BaseApplication
+
+    class _App(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", processes)
+            self.cfg.set("threads", workers)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("keepalive", 5)
+
+        def load(self):
+            return app
+
+    _App().run()
+
+def _serve_threaded(app, host, port, workers, processes):
+    from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+    class _QuietHandler(WSGIRequestHandler):
+        timeout = 5  # a stalled client gives its worker back
+
+        def log_request(self, *args, **kwargs):
+            pass  # per-request access logs would dominate under load
+
+    class _PooledServer(BaseWSGIServer):
+        multithread = True
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.pool = ThreadPoolExecutor(workers, thread_name_prefix="wsgi")
+
+        def process_request(self, request, client_address):
+            self.pool.submit(self._handle, request, client_address)
+
+        def _handle(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    _PooledServer(host, port, app, handler=_QuietHandler).serve_forever()
+
+SERVERS = {"waitress": _serve_waitress, "gunicorn": _serve_gunicorn, "threaded": _serve_threaded}
+
+def pick_server(name):
+    if name != "auto":
+        return name
+    for candidate, module in (("waitress", "waitress"), ("gunicorn", "gunicorn")):
+        if candidate == "gunicorn" and os.name != "posix":
+            continue
+        try:
+            importlib.import_module(module)
+            return candidate
+        except ImportError:
+            pass
+    return "threaded"
+
+def serve(service, host="0.0.0.0", port=None, workers=8, processes=1, server="auto"):
+    os.chdir(ROOT)  # config paths are relative to the project root
+    app = load_app(service)
+    port = port or APPS[service][1]
+    server = pick_server(server)
+    shape = f"{processes} x {workers}" if server == "gunicorn" else f"{workers}"
+    print(f"[serve] {service} on {host}:{port} via {server} ({shape} workers)", flush=True)
+    SERVERS[server](app, host, port, workers, processes)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a microservice on a production WSGI server")
+    parser.add_argument("service", choices=sorted(APPS))
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=None, help="default: the service's usual port")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SERVICE_WORKERS", "8")),
+                        help="request threads (per process with gunicorn); env SERVICE_WORKERS")
+    parser.add_argument("--processes", type=int, default=int(os.getenv("SERVICE_PROCESSES", "1")),
+                        help="worker processes (gunicorn only); env SERVICE_PROCESSES")
+    parser.add_argument("--server", choices=["auto"] + sorted(SERVERS), default="auto")
+    args = parser.parse_args()
+    serve(args.service, args.host, args.port, args.workers, args.processes, args.server)
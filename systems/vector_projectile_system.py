@@ -0,0 +1,155 @@
+import pygame
+import numpy as np
+from core.object_pool import release
+from core.projectile import Projectile, DEBUG_PROJECTILES
+from core.projectile_sprites import ProjectileSprites
+from core.spatial_hash import SpatialHash
+
+# column layout of the state array (one row per live projectile)
+X, Y, DX, DY, SPEED, STEP, TRAVELLED, MAX_RANGE, W, H, TIP, FACTION = range(12)
+N_COLS = 12
+FACTION_PLAYER, FACTION_ENEMY = 0.0, 1.0
+
+
+class VectorProjectileSystem:
+    """
+    Structure-of-arrays ProjectileSystem backend.
+
+    Positions, directions, speeds, travelled distance, hitbox size and owner
+    faction live in one NumPy array; integration, range and wall checks run as
+    vectorized passes over all projectiles. The Projectile objects are kept in
+    a parallel list only for their image and hit/impact handling, and dead
+    slots are compacted out at the end of every update.
+    """
+    def __init__(self, walls, enemies, explosion_system, players=None, damage_client=None, capacity=256):
+        self.walls       = walls
+        self.enemies     = enemies
+        self.players     = players
+        self.explosions  = explosion_system.explosions
+        # optional AsyncDamageClient; None resolves damage in-process
+        self.damage_client = damage_client
+        self.state       = np.zeros((capacity, N_COLS), dtype=np.float64)
+        self.objects     = []
+        self.pool        = Projectile.pool  # dead slots are released to it on compaction
+        self.actor_hash  = SpatialHash()
+
+    def __len__(self):
+        return len(self.objects)
+
+    @property
+    def projectiles(self):
+        # live Projectile objects; positions are only synced back on impact
+        return list(self.objects)
+
+    def add(self, projectile):
+        n = len(self.objects)
+        if n == len(self.state):
+            self.state = np.concatenate([self.state, np.zeros_like(self.state)])
+        p = projectile
+        self.state[n] = (p.x, p.y, p.dx, p.dy, p.speed, p.speed * np.hypot(p.dx, p.dy), p.travelled,
+                         p.max_range, p.rect.width, p.rect.height, p.tip_offset,
+                         FACTION_ENEMY if p.from_enemy else FACTION_PLAYER)
+        self.objects.append(p)
+
+    def _sync(self, i):
+        p, row = self.objects[i], self.state[i]
+        p.x, p.y, p.travelled = float(row[X]), float(row[Y]), float(row[TRAVELLED])
+        p._sync_rect()
+        return p
+
+    def _hit_actors(self, alive, left, top, w, h, s, group, faction, on_hit):
+        if not group:
+            return
+        idx = np.flatnonzero(alive & (s[:, FACTION] == faction))
+        if len(idx) == 0:
+            return
+        # broad phase: hash the actors near these shots, join shots against its cells
+        l, t, ww, hh = left[idx], top[idx], w[idx], h[idx]
+        bounds = pygame.Rect(int(l.min()), int(t.min()),
+                             int((l + ww).max() - l.min()), int((t + hh).max() - t.min()))
+        actors = self.actor_hash
+        actors.rebuild(group, bounds)
+        shot, owner = actors.pairs(l, t, ww, hh)
+        # contacts come actor by actor, each actor's shots in order (as the old per-actor scan)
+        for i, a in zip(idx[shot].tolist(), owner.tolist()):
+            actor = actors.sprites[a]
+            if alive[i] and actor.alive():  # killed: later shots pass through, as with spritecollide
+                on_hit(self._sync(i), actor)
+                alive[i] = False
+
+    def update(self, dt):
+        if self.damage_client is not None:
+            self.damage_client.drain()
+        n = len(self.objects)
+        if n == 0:
+            return
+        s = self.state[:n]
+
+        # integrate
+        s[:, X] += s[:, DX] * s[:, SPEED] * dt
+        s[:, Y] += s[:, DY] * s[:, SPEED] * dt
+        s[:, TRAVELLED] += s[:, STEP] * dt
+        alive = np.ones(n, dtype=bool)
+
+        # range limit
+        for i in np.flatnonzero(s[:, TRAVELLED] >= s[:, MAX_RANGE]):
+            self._sync(i).expire(self.explosions)
+            alive[i] = False
+
+        # hitbox rects, matching Projectile._sync_rect (center truncated to int)
+        w, h = s[:, W].astype(np.int64), s[:, H].astype(np.int64)
+        left = np.trunc(s[:, X] - s[:, DX] * s[:, TIP]).astype(np.int64) - w // 2
+        top  = np.trunc(s[:, Y] - s[:, DY] * s[:, TIP]).astype(np.int64) - h // 2
+
+        # wall collisions
+        if self.walls:
+            idx = np.flatnonzero(alive)
+            if hasattr(self.walls, "rects_solid"):
+                hit = np.asarray(self.walls.rects_solid(left[idx], top[idx], w[idx], h[idx]), dtype=bool)
+            else:
+                hit = np.array([self.walls.collides((int(left[i]), int(top[i]), int(w[i]), int(h[i])))
+                                for i in idx], dtype=bool)
+            for i in idx[hit]:
+                self._sync(i).hit_wall(self.explosions)
+                alive[i] = False
+
+        # actor collisions: player shots vs enemies, enemy shots vs players
+        self._hit_actors(alive, left, top, w, h, s, self.enemies, FACTION_PLAYER,
+                         lambda p, e: p.hit_enemy(e, self.explosions, self.damage_client))
+        self._hit_actors(alive, left, top, w, h, s, self.players, FACTION_ENEMY,
+                         lambda p, pl: p.hit_player(pl, self.explosions))
+
+        if self.damage_client is not None:
+            self.damage_client.flush()  # one batched request per tick
+
+        # compact dead slots
+        if not alive.all():
+            for i in np.flatnonzero(~alive):
+                release(self.objects[i])
+            keep = np.flatnonzero(alive)
+            self.state[:len(keep)] = s[keep]
+            self.objects = [self.objects[i] for i in keep]
+
+    def draw(self, surface, camera, lag=0.0):
+        # lag: seconds to step back along each projectile's path for render interpolation
+        n = len(self.objects)
+        if n == 0:
+            return
+        s, zoom = self.state[:n], camera.zoom
+        sx = ((s[:, X] - s[:, DX] * s[:, SPEED] * lag - camera.offset_x) * zoom).astype(np.int64)
+        sy = ((s[:, Y] - s[:, DY] * s[:, SPEED] * lag - camera.offset_y) * zoom).astype(np.int64)
+        # cull anything well outside the viewport before touching Python objects
+        margin = 64 * zoom
+        visible = np.flatnonzero((sx > -margin) & (sx < surface.get_width() + margin) &
+                                 (sy > -margin) & (sy < surface.get_height() + margin))
+        blits = []
+        for i in visible:
+            p, x, y = self.objects[i], int(sx[i]), int(sy[i])
+            if p.is_circle:
+                pygame.draw.circle(surface, p.color, (x, y), max(1, int(p.radius * zoom)))
+            else:
+                img = ProjectileSprites.get(p.image_path, p.angle_bucket, zoom)
+                blits.append((img, img.get_rect(center=(x, y))))
+            if DEBUG_PROJECTILES:
+                self._sync(i)._debug_draw(surface, x, y, zoom)
+        surface.blits(blits, False)
@@ -0,0 +1,40 @@
+# tests/test_damage_service.py
+import os, sys, math
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # the config path is relative to the project root
+
+from services.damage_service import DamageService
+
+TYPES = ["ki", "fire", "ice", "_default", "unknown"]
+EDGE_DISTANCES = [0.0, -0.0, 1e-9, 99.9, 100.0, 1500.0, -1.0, -1e30,
+                  float("nan"), float("inf"), float("-inf"), 1e18, 1e30, 1e308]
+
+def test_scalar_and_batched_agree_on_edge_distances():
+    for t in TYPES:
+        scalar = [DamageService.get_damage(t, d) for d in EDGE_DISTANCES]
+        batched = list(DamageService.get_damages([t] * len(EDGE_DISTANCES), EDGE_DISTANCES))
+        assert scalar == batched, (t, scalar, batched)
+        assert list(DamageService.get_damages(t, EDGE_DISTANCES)) == scalar, t
+
+def test_non_finite_distances_are_bounded():
+    for t in TYPES:
+        nearest = DamageService.get_damage(t, 0.0)
+        assert DamageService.get_damage(t, float("nan")) == nearest
+        assert DamageService.get_damage(t, float("-inf")) == nearest
+        assert DamageService.get_damage(t, -50.0) == nearest
+        assert 1 <= DamageService.get_damage(t, float("inf")) <= nearest
+        assert DamageService.get_damage(t, float("inf")) == DamageService.get_damage(t, 1e30)
+
+def test_tables_match_the_formula():
+    for t in TYPES:
+        rule = DamageService._rule(t)
+        for i in range(0, 3000, 7):
+            d = i * 0.5
+            assert DamageService.get_damage(t, d) == DamageService._formula(rule, d), (t, d)
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print("ok", name)
@@ -0,0 +1,42 @@
+import pygame
+
+class ProfilerOverlay:
+    # toggled with F3 from the HUD; draws nothing while the profiler is disabled
+    GRAPH_H = 40
+    BUDGET_MS = 1000 / 60
+
+    def __init__(self, profiler, font, x=20, y=130, width=280):
+        self.profiler = profiler
+        self.font = font
+        self.x, self.y, self.width = x, y, width
+
+    def draw(self, surface):
+        if not self.profiler.enabled:
+            return
+        frames = self.profiler.frame_times()
+        avg_frame = sum(frames) / len(frames) if frames else 0.0
+        lines = [f"FPS {self.profiler.fps():5.1f}  frame {avg_frame:5.2f} ms"]
+        for name, ms in sorted(self.profiler.averages().items()):
+            indent = "  " * name.count(".")
+            lines.append(f"{indent}{name.rsplit('.', 1)[-1]:<{16 - len(indent)}}{ms:6.2f} ms")
+        for name, value in sorted(self.profiler.counters.items()):
+            lines.append(f"{name:<16}{value:>6}")
+
+        line_h = self.font.get_linesize()
+        height = len(lines) * line_h + self.GRAPH_H + 16
+        bg = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 170))
+        surface.blit(bg, (self.x, self.y))
+        for i, line in enumerate(lines):
+            surface.blit(self.font.render(line, True, (220, 255, 220)), (self.x + 6, self.y + 4 + i * line_h))
+
+        # frame-time graph: one bar per frame, red above the 60 fps budget
+        gx, gy = self.x + 6, self.y + height - self.GRAPH_H - 6
+        gw = self.width - 12
+        scale = self.GRAPH_H / (2 * self.BUDGET_MS)
+        budget_y = gy + self.GRAPH_H - int(self.BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 255, 0), (gx, budget_y), (gx + gw, budget_y), 1)
+        for i, ms in enumerate(frames[-gw:]):
+            h = min(self.GRAPH_H, int(ms * scale))
+            col = (255, 80, 80) if ms > self.BUDGET_MS else (80, 220, 80)
+            pygame.draw.line(surface, col, (gx + i, gy + self.GRAPH_H), (gx + i, gy + self.GRAPH_H - h), 1)
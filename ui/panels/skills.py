@@ -10,7 +10,7 @@ class SkillsPanel:
         # store last panel coords so we can recalc in handle_click()
         self._panel_pos = (0, 0)
 
-    def handle_click(self, pos, player, projectile_system, dt, collision_rects, map_rect):
+    def handle_click(self, pos, player, projectile_system, dt, collision_rects, map_rect, keys=None):
         x, y = self._panel_pos
 
         # recompute button positions
@@ -21,7 +21,7 @@ class SkillsPanel:
         if self.dash_rect.collidepoint(pos):
             player.try_dash(dt, collision_rects, map_rect) 
         elif self.ki_rect.collidepoint(pos):
-            proj = player.try_shoot(pygame.key.get_pressed())
+            proj = player.try_shoot(keys if keys is not None else pygame.key.get_pressed())
             if proj:
                 projectile_system.add(proj)
 
@@ -1,23 +1,87 @@
 import pygame
+from collections import OrderedDict
 from pytmx import TiledTileLayer
+
 class TilemapRenderer:
-    def __init__(self, tmx_data, camera):
+    # visible tile layers are baked into CHUNK_TILES x CHUNK_TILES surfaces,
+    # one set per zoom level, and evicted LRU once memory_budget is exceeded
+    CHUNK_TILES = 16
+    MEMORY_BUDGET = 64 * 1024 * 1024
+
+    def __init__(self, tmx_data, camera, chunk_tiles=CHUNK_TILES, memory_budget=MEMORY_BUDGET):
         self.tmx_data = tmx_data
         self.camera = camera
+        self.chunk_tiles = chunk_tiles
+        self.memory_budget = memory_budget
+        self.layers = [l for l in tmx_data.visible_layers if isinstance(l, TiledTileLayer)]
+        self._chunks = OrderedDict()   # (zoom, cx, cy) -> Surface | None (empty chunk)
+        self._bytes = 0
+        self._frame_keys = set()
+
+    @property
+    def cache_bytes(self):
+        return self._bytes
+
+    def invalidate(self):
+        self._chunks.clear()
+        self._bytes = 0
+
+    def _bake_chunk(self, cx, cy, zoom):
+        tw, th, n = self.tmx_data.tilewidth, self.tmx_data.tileheight, self.chunk_tiles
+        x0, y0 = cx * n, cy * n
+        chunk = None
+        for layer in self.layers:
+            for y in range(y0, min(layer.height, y0 + n)):
+                row = layer.data[y]
+                for x in range(x0, min(layer.width, x0 + n)):
+                    img = self.tmx_data.get_tile_image_by_gid(row[x] & 0x1FFFFFFF)
+                    if img:
+                        if chunk is None:
+                            chunk = pygame.Surface((n * tw, n * th), pygame.SRCALPHA)
+                        chunk.blit(img, ((x - x0) * tw, (y - y0) * th))
+        if chunk is not None and zoom != 1.0:
+            # scale the whole chunk once instead of every tile every frame
+            chunk = pygame.transform.scale(chunk, (int(n * tw * zoom), int(n * th * zoom)))
+        return chunk
+
+    def _get_chunk(self, cx, cy, zoom):
+        key = (zoom, cx, cy)
+        self._frame_keys.add(key)
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+        chunk = self._bake_chunk(cx, cy, zoom)
+        self._chunks[key] = chunk
+        if chunk is not None:
+            self._bytes += chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+            self._evict()
+        return chunk
+
+    def _evict(self):
+        # never drop a chunk the current frame still needs
+        while self._bytes > self.memory_budget:
+            victim = next((k for k in self._chunks if k not in self._frame_keys), None)
+            if victim is None:
+                break
+            chunk = self._chunks.pop(victim)
+            if chunk is not None:
+                self._bytes -= chunk.get_width() * chunk.get_height() * chunk.get_bytesize()
+
     def draw(self, surface):
         tw, th = self.tmx_data.tilewidth, self.tmx_data.tileheight
-        sx = int(self.camera.offset_x // tw)
-        sy = int(self.camera.offset_y // th)
-        ex = int((self.camera.offset_x + self.camera.viewport_width/self.camera.zoom) // tw) + 1
-        ey = int((self.camera.offset_y + self.camera.viewport_height/self.camera.zoom) // th) + 1
-        for layer in self.tmx_data.visible_layers:
-            if isinstance(layer, TiledTileLayer):
-                for x in range(max(0, sx), min(layer.width, ex)):
-                    for y in range(max(0, sy), min(layer.height, ey)):
-                        gid = layer.data[y][x]
-                        img = self.tmx_data.get_tile_image_by_gid(gid & 0x1FFFFFFF)
-                        if img:
-                            dx = int((x*tw - self.camera.offset_x)*self.camera.zoom)
-                            dy = int((y*th - self.camera.offset_y)*self.camera.zoom)
-                            img_s = pygame.transform.scale(img, (int(tw*self.camera.zoom), int(th*self.camera.zoom)))
-                            surface.blit(img_s, (dx, dy))
+        zoom = self.camera.zoom
+        cw, ch = tw * self.chunk_tiles, th * self.chunk_tiles
+        cols = -(-self.tmx_data.width // self.chunk_tiles)
+        rows = -(-self.tmx_data.height // self.chunk_tiles)
+        sx = int(self.camera.offset_x // cw)
+        sy = int(self.camera.offset_y // ch)
+        ex = int((self.camera.offset_x + self.camera.viewport_width/zoom) // cw) + 1
+        ey = int((self.camera.offset_y + self.camera.viewport_height/zoom) // ch) + 1
+        self._frame_keys = set()
+        for cy in range(max(0, sy), min(rows, ey)):
+            for cx in range(max(0, sx), min(cols, ex)):
+                chunk = self._get_chunk(cx, cy, zoom)
+                if chunk is not None:
+                    dx = int((cx*cw - self.camera.offset_x)*zoom)
+                    dy = int((cy*ch - self.camera.offset_y)*zoom)
+                    surface.blit(chunk, (dx, dy))
@@ -1,20 +1,21 @@
 
-import pygame, json, urllib.request, urllib.error, urllib.parse
+import pygame, urllib.parse
 import collections
 from entities.player import Player
+from core.jobs import JOBS
+from services.service_client import SERVICES
 # from services.race_service import RaceService
 
 RACE_CACHE = {}
 
-def race_get_metadata(race: str, base_url: str = "http://localhost:7001") -> dict:
+def race_get_metadata(race: str, base_url: str = None) -> dict:
+    # base_url defaults to the shared ServiceClient's "race" service
     try:
-        url = f"{base_url}/races/{urllib.parse.quote(race)}/metadata"
-        with urllib.request.urlopen(url, timeout=0.5) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        return SERVICES.get("race.metadata", f"/races/{urllib.parse.quote(race)}/metadata", base_url=base_url)
     except Exception:
         return {"description": "", "bonuses": {}, "stats": {}}
 
-def race_get_metadata_cached(race: str, base_url: str = "http://localhost:7001") -> dict:
+def race_get_metadata_cached(race: str, base_url: str = None) -> dict:
     if race in RACE_CACHE:
         return RACE_CACHE[race]
     data = race_get_metadata(race, base_url=base_url)
@@ -30,16 +31,11 @@ class CharacterCreateScreen:
         self.char_name = ""
         self.preview = Player(400, 420, race=self.races[self.selected])
 
-        # Prefetch race metadata asynchronously so selection/enter never blocks
-        import threading
-        def _prefetch_all():
-            for r in list(self.races):
-                try:
-                    if r not in RACE_CACHE:
-                        RACE_CACHE[r] = race_get_metadata(r)
-                except Exception:
-                    pass
-        threading.Thread(target=_prefetch_all, daemon=True).start()
+        # Prefetch race metadata on the job pool so selection/enter never blocks;
+        # results are cached on the main thread as the loop drains them
+        for r in self.races:
+            if r not in RACE_CACHE:
+                JOBS.submit(race_get_metadata, r, on_done=lambda data, r=r: RACE_CACHE.setdefault(r, data))
 
         # Preview animation state
         self.preview_direction_index = 0
@@ -59,7 +55,7 @@ class CharacterCreateScreen:
 
             dir_name = self.preview_directions[self.preview_direction_index]
             self.preview.direction = dir_name
-            self.preview.image = self.preview.animations[dir_name][self.preview_frame_index]
+            self.preview.set_frame(True, dir_name, self.preview_frame_index)
 
         # No movement
         fake_keys = collections.defaultdict(lambda: False)
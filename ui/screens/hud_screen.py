@@ -1,37 +1,49 @@
 # /mnt/data/hud_screen.py  (core/ui/screens/hud_screen.py in your tree)
 import os, random, math, pygame, pytmx
 from typing import Optional
-from typing import cast
 from entities.player      import Player
 from entities.enemies     import Enemy
 from core.camera          import Camera
+from core.collision_bitmap import CollisionBitmap
+from core.profiler        import PROFILER
+from core.jobs            import JOBS
 from systems.player_controller   import PlayerController
 from systems.projectile_system   import ProjectileSystem
+try:
+    from systems.vector_projectile_system import VectorProjectileSystem
+except ImportError:  # NumPy not installed: keep the sprite-based system
+    VectorProjectileSystem = None
 from systems.explosion_system    import ExplosionSystem
 from systems.enemy_controller    import EnemyController
+try:
+    from systems.horde_enemy_controller import HordeEnemyController
+except ImportError:  # NumPy not installed: horde mode falls back to EnemyController
+    HordeEnemyController = None
 from ui.render.tilemap_renderer  import TilemapRenderer
 from ui.components.canvas_border import CanvasBorder
 from ui.components.exit_dialog   import ExitDialog
 from ui.components.tab_manager   import TabManager
 from ui.components.draggable_vitals_box import DraggableVitalsBox
+from ui.components.profiler_overlay import ProfilerOverlay
 from ui.panels.skills  import SkillsPanel
 from ui.panels.vitals  import VitalsPanel
-from core.explosion import Explosion
 # from services.spawn_validator import SpawnValidator
-import json, urllib.request, urllib.error
 from services.chat_client import ChatClient
-import threading
-
-class Wall(pygame.sprite.Sprite):
-    def __init__(self, rect: pygame.Rect):
-        super().__init__()
-        self.rect = rect
-
+from services.damage_client import AsyncDamageClient
+from services.service_client import SERVICES
 
 class HUDScreen:
-    def __init__(self, game, player=None):
+    def __init__(self, game, player=None, seed=None, fetch_spawns=True, horde=False):
         self.game = game
 
+        # seed the RNG behind enemy patrols/spawns; recordings always need one
+        self.recorder = getattr(game, "recorder", None)
+        if seed is None and self.recorder is not None:
+            seed = random.randrange(2 ** 63)
+        if seed is not None:
+            random.seed(seed)
+        self.seed = seed
+
         # ────────────────────── MAP / COLLISION ─────────────────────────────
         tmx_path   = os.path.join("assets", "maps", "test_map.tmx")
         tmx_data   = pytmx.load_pygame(tmx_path)
@@ -46,10 +58,9 @@ class HUDScreen:
                 for obj in layer:
                     self.collision_tiles.append(pygame.Rect(obj.x, obj.y, obj.width, obj.height))
 
-        # sprite-based walls (helps with projectile collision)
-        self.wall_sprites = pygame.sprite.Group()
-        for r in self.collision_tiles:
-            self.wall_sprites.add(Wall(r))
+        # per-tile collision bitmap (backed by a grid index over the rects),
+        # shared by movement, projectiles and spawns
+        self.collision_map = CollisionBitmap.from_tmx(tmx_data, self.collision_tiles)
 
         # ────────────────────── PLAYER ──────────────────────────────────────
         spawn_x, spawn_y = 100, 100
@@ -67,11 +78,14 @@ class HUDScreen:
         else:
             # fallback: create a default player
             self.player = Player(spawn_x, spawn_y)
+        if self.recorder is not None:
+            self.recorder.start(seed, round(1.0 / game.fixed_dt), self.player.race, self.player.name,
+                                player_given=player is not None)
 
         self.draggable_vitals_box = DraggableVitalsBox(self.player)
 
         # chat microservice client (proxy or teammate service)
-        self.chat_client = ChatClient(base_url="http://localhost:7004")
+        self.chat_client = ChatClient()
 
         # ────────────────────── ENEMIES & SYSTEMS ───────────────────────────
         self.enemies = pygame.sprite.Group()
@@ -79,11 +93,13 @@ class HUDScreen:
         self.players.add(self.player)
 
         self.explosion_system = ExplosionSystem()
-        self.projectile_system = ProjectileSystem(
-            walls=self.wall_sprites,
+        self.projectile_system = (VectorProjectileSystem or ProjectileSystem)(
+            walls=self.collision_map,
             enemies=self.enemies,
             explosion_system=self.explosion_system,
-            players=self.players
+            players=self.players,
+            # set DAMAGE_SERVICE_URL to resolve hits via damage_api (asynchronously)
+            damage_client=AsyncDamageClient() if os.getenv("DAMAGE_SERVICE_URL") else None
         )
 
         self.projectile_group: Optional[pygame.sprite.Group] = None
@@ -93,30 +109,22 @@ class HUDScreen:
         def _rects_to_payload(rects):
             return [[r.x, r.y, r.width, r.height] for r in rects]
 
-        # Start async fetch to avoid blocking HUD init
+        # Fetch in the background to avoid blocking HUD init; the result is handed
+        # over on the main thread (JOBS.drain) and applied at the next tick
         self._pending_spawns = None
-        def _fetch_spawns_async():
-            try:
-                payload = json.dumps({
-                    "want": want,
-                    "map_width": self.map_width,
-                    "map_height": self.map_height,
-                    "collider_rects": _rects_to_payload(self.collision_tiles),
-                    "avoid_point": [spawn_x, spawn_y],
-                    "min_distance": min_dist
-                }).encode("utf-8")
-                req = urllib.request.Request(
-                    "http://localhost:7003/spawns/generate",
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                with urllib.request.urlopen(req, timeout=0.5) as resp:
-                    data = json.loads(resp.read().decode("utf-8")) or {}
-                    self._pending_spawns = data.get("spawns", [])
-            except Exception:
-                self._pending_spawns = None
-        threading.Thread(target=_fetch_spawns_async, daemon=True).start()
+        def _fetch_spawns(payload):
+            return (SERVICES.post("spawn.generate", "/spawns/generate", payload) or {}).get("spawns", [])
+        def _spawns_ready(spawns):
+            self._pending_spawns = spawns
+        if fetch_spawns:
+            JOBS.submit(_fetch_spawns, {
+                "want": want,
+                "map_width": self.map_width,
+                "map_height": self.map_height,
+                "collider_rects": _rects_to_payload(self.collision_tiles),
+                "avoid_point": [spawn_x, spawn_y],
+                "min_distance": min_dist
+            }, on_done=_spawns_ready)
 
         # immediate fallback so HUD loads now
         spawns = [(spawn_x + 200, spawn_y + 0),
@@ -127,12 +135,14 @@ class HUDScreen:
 
         for (sx, sy) in spawns:
             e = Enemy(sx, sy)
-            e.projectile_group = cast(pygame.sprite.Group, self.projectile_system.projectiles)
+            e.projectile_group = self.projectile_system
             self.enemies.add(e)
 
         # controllers / helpers
-        self.player_controller = PlayerController(self.player, self.collision_tiles, self.map_rect)
-        self.enemy_controller  = EnemyController(self.enemies, self.collision_tiles, self.map_rect)
+        self.player_controller = PlayerController(self.player, self.collision_map, self.map_rect)
+        # horde mode: vectorized enemy AI for thousands of enemies
+        controller_cls = HordeEnemyController if horde and HordeEnemyController else EnemyController
+        self.enemy_controller  = controller_cls(self.enemies, self.collision_map, self.map_rect)
 
         # camera & renderer
         self.camera        = Camera(800, 600, world_width=self.map_width, world_height=self.map_height)
@@ -146,6 +156,7 @@ class HUDScreen:
         self.tab_manager = TabManager(self.tab_panels, self.font)
         self.exit_dialog = ExitDialog(self.camera, self.font)
         self.border      = CanvasBorder(self.camera, self.player, self.coord_font)
+        self.profiler_overlay = ProfilerOverlay(PROFILER, self.coord_font)
 
         # chat
         self.chat_messages: list[str] = []
@@ -155,33 +166,35 @@ class HUDScreen:
         self.chat_scroll      = 0
 
     # ───────────────────────── UPDATE ───────────────────────────────────────
-    def update(self, dt: float, events: list[pygame.event.Event]):
-        keys = pygame.key.get_pressed()
-        if not self.chat_input_active:
-            self.player_controller.update(dt, keys, self.projectile_system, self.chat_input_active)
+    def update(self, dt: float, events: list[pygame.event.Event], keys=None):
+        self._prev_state = self._snapshot()
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        # spawn-service results arrive between ticks: take them once, at a tick boundary
+        spawns = None
+        if getattr(self, "_pending_spawns", None) is not None and not getattr(self, "_pending_spawns_applied", False):
+            spawns = self._pending_spawns
+            self._pending_spawns_applied = True
+        if self.recorder is not None:
+            self.recorder.write_tick(keys, events, spawns)
+
+        with PROFILER.scope("update.player"):
+            if not self.chat_input_active:
+                self.player_controller.update(dt, keys, self.projectile_system, self.chat_input_active)
 
-        self.projectile_system.update(dt)
+        with PROFILER.scope("update.projectiles"):
+            self.projectile_system.update(dt)
 
         # If spawn service responded, add those spawns once
-        if getattr(self, "_pending_spawns", None) is not None and not getattr(self, "_pending_spawns_applied", False):
-            for (sx, sy) in (self._pending_spawns or []):
-                e = Enemy(sx, sy)
-                e.projectile_group = cast(pygame.sprite.Group, self.projectile_system.projectiles)
-                self.enemies.add(e)
-            self._pending_spawns_applied = True
-        
-        # check enemy‐shot projectiles against the player
-        for p in list(self.projectile_system.projectiles):
-            if getattr(p, "from_enemy", False) and self.player.rect.colliderect(p.rect):
-                # damage & explosion
-                self.player.health -= 10
-                self.explosion_system.explosions.add(
-                    Explosion(p.x, p.y)
-                )
-                p.kill()
-
-        self.explosion_system.update(dt)
-        self.enemy_controller.update(dt, self.player)
+        for (sx, sy) in (spawns or []):
+            e = Enemy(sx, sy)
+            e.projectile_group = self.projectile_system
+            self.enemies.add(e)
+
+        with PROFILER.scope("update.explosions"):
+            self.explosion_system.update(dt)
+        with PROFILER.scope("update.enemies"):
+            self.enemy_controller.update(dt, self.player, self.camera)
 
         # simple respawn if player dies
         if self.player.health <= 0:
@@ -189,8 +202,20 @@ class HUDScreen:
             self.player.rect.center = (self.spawn_x, self.spawn_y)
 
         self.camera.follow(self.player.rect)
+        if PROFILER.active:
+            PROFILER.count("enemies", len(self.enemies))
+            PROFILER.count("projectiles", len(self.projectile_system.projectiles))
+            PROFILER.count("explosions", len(self.explosion_system.explosions))
+            # pool misses should level off once the free lists cover the peak
+            PROFILER.count("pool.projectiles.misses", self.projectile_system.pool.misses)
+            PROFILER.count("pool.explosions.misses", self.explosion_system.pool.misses)
+            PROFILER.count("service.errors", SERVICES.errors)
 
         # ─── UI & chat handling (kept compact) ─────────────────────────────
+        with PROFILER.scope("update.ui"):
+            self._update_ui(dt, events, keys)
+
+    def _update_ui(self, dt: float, events: list[pygame.event.Event], keys):
         self.tab_manager.handle_events(events)
         self.exit_dialog.handle_events(events)
 
@@ -204,8 +229,9 @@ class HUDScreen:
                         self.player,
                         self.projectile_system,
                         dt,
-                        self.collision_tiles,
-                        self.map_rect
+                        self.collision_map,
+                        self.map_rect,
+                        keys
                     )
 
         input_box = pygame.Rect(400, 390, 500, 24)
@@ -214,6 +240,10 @@ class HUDScreen:
             if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                 self.exit_dialog.show = True
 
+            # F3 toggles the profiler overlay
+            if ev.type == pygame.KEYDOWN and ev.key == pygame.K_F3:
+                PROFILER.toggle()
+
             # TAB always toggles sidebar
             if ev.type == pygame.KEYDOWN and ev.key == pygame.K_TAB:
                 self.panel_visible = not self.panel_visible
@@ -238,17 +268,10 @@ class HUDScreen:
                     self.chat_input = ""
                     self.chat_scroll = 0
 
-                    def _send_chat_async():
-                        result = self.chat_client.filter_and_log(username, msg)
-                        if not result.get("allowed", True):
-                            reason = result.get("reason") or "blocked"
-                            # replace optimistic line with block notice
-                            self.chat_messages[idx] = f"[system]: message blocked ({reason})"
-                        else:
-                            reason = str(result.get("reason") or "")
-                            if "microservice_unreachable" in reason:
-                                self.chat_messages[idx] += "  [unverified: chat filter offline]"
-                    threading.Thread(target=_send_chat_async, daemon=True).start()
+                    # filtered off-thread; the verdict is applied on the main thread
+                    if not JOBS.submit(self.chat_client.filter_and_log, username, msg,
+                                       on_done=lambda result, idx=idx: self._apply_chat_result(idx, result)):
+                        self.chat_messages[idx] += "  [unverified: chat filter busy]"
                 
                 elif ev.key == pygame.K_BACKSPACE:
                     self.chat_input = self.chat_input[:-1]
@@ -261,22 +284,73 @@ class HUDScreen:
                     self.chat_input += ev.unicode
             
 
+    def _apply_chat_result(self, idx: int, result: dict):
+        if not result.get("allowed", True):
+            reason = result.get("reason") or "blocked"
+            # replace optimistic line with block notice
+            self.chat_messages[idx] = f"[system]: message blocked ({reason})"
+        else:
+            reason = str(result.get("reason") or "")
+            if "microservice_unreachable" in reason:
+                self.chat_messages[idx] += "  [unverified: chat filter offline]"
+
     # ───────────────────────── DRAW ────────────────────────────────────────
     def draw(self, surface: pygame.Surface):
-        self.map_renderer.draw(surface)
-        self.player_controller.draw(surface, self.camera)
-        self.projectile_system.draw(surface, self.camera)
-        self.explosion_system.draw(surface, self.camera)
-        self.enemy_controller.draw(surface, self.camera)
-        self.draggable_vitals_box.draw(surface)
-
-        # sidebar + chat
-        if self.panel_visible:
-            self.tab_manager.draw(surface)
-            self._draw_chat(surface)
-
-        self.exit_dialog.draw(surface)
-        self.border.draw(surface)
+        # render between the previous and current simulation step
+        alpha = getattr(self.game, "render_alpha", 1.0)
+        restore = self._interpolate(alpha) if alpha < 1.0 else None
+        lag = (1.0 - alpha) * getattr(self.game, "fixed_dt", 0.0)
+
+        with PROFILER.scope("draw.map"):
+            self.map_renderer.draw(surface)
+        with PROFILER.scope("draw.player"):
+            self.player_controller.draw(surface, self.camera)
+        with PROFILER.scope("draw.projectiles"):
+            self.projectile_system.draw(surface, self.camera, lag)
+        with PROFILER.scope("draw.explosions"):
+            self.explosion_system.draw(surface, self.camera)
+        with PROFILER.scope("draw.enemies"):
+            self.enemy_controller.draw(surface, self.camera)
+        if restore:
+            restore()
+
+        with PROFILER.scope("draw.ui"):
+            self.draggable_vitals_box.draw(surface)
+
+            # sidebar + chat
+            if self.panel_visible:
+                self.tab_manager.draw(surface)
+                self._draw_chat(surface)
+
+            self.exit_dialog.draw(surface)
+            self.border.draw(surface)
+        self.profiler_overlay.draw(surface)
+
+    # ───────────────────────── INTERPOLATION ───────────────────────────────
+    def _snapshot(self):
+        positions = {s: s.rect.topleft for s in (self.player, *self.enemies)}
+        return (self.camera.offset_x, self.camera.offset_y), positions
+
+    def _interpolate(self, alpha: float):
+        # temporarily move camera/actors to the blended state; returns an undo callback
+        prev = getattr(self, "_prev_state", None)
+        if prev is None:
+            return None
+        current = self._snapshot()
+        (pcx, pcy), prev_pos = prev
+        (ccx, ccy), cur_pos = current
+        self.camera.offset_x = pcx + (ccx - pcx) * alpha
+        self.camera.offset_y = pcy + (ccy - pcy) * alpha
+        for sprite, (cx, cy) in cur_pos.items():
+            if sprite in prev_pos:
+                px, py = prev_pos[sprite]
+                sprite.rect.topleft = (round(px + (cx - px) * alpha), round(py + (cy - py) * alpha))
+
+        def restore():
+            self.camera.offset_x, self.camera.offset_y = ccx, ccy
+            for sprite, pos in cur_pos.items():
+                sprite.rect.topleft = pos
+        return restore
 
     # helper
     def _draw_chat(self, surface: pygame.Surface):